@@ -4,5 +4,13 @@ pragma solidity 0.8.18;
 contract Deployer {
     event Deployed(address addr, uint256 salt);
 
-    function deploy(bytes memory code, uint256 salt) external {}
+    function deploy(bytes memory code, uint256 salt) external {
+        address addr;
+        assembly {
+            addr := create2(0, add(code, 0x20), mload(code), salt)
+        }
+        require(addr.code.length > 0, "deploy failed");
+
+        emit Deployed(addr, salt);
+    }
 }
@@ -0,0 +1,16 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.8.18;
+
+contract MockVault {
+    address public asset;
+
+    constructor(address _asset) {
+        asset = _asset;
+    }
+
+    function strategies(
+        address
+    ) external pure returns (uint256, uint256, uint256, uint256) {
+        revert("strategies called");
+    }
+}
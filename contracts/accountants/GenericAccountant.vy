@@ -13,11 +13,12 @@
     underlying tokens. There is a degault fee config that will be used for 
     any strategy that reports through a vault thas has been added to this
     accountant. But also gives the ability for the fee_manager to choose 
-    custom values for any value for any given strategy they want to.
+    custom values for any value for any given strategy they want to, or a
+    default for every strategy of a specific vault.
 
     Funds received from the vaults can either be distributed to a specified
     fee_recipient or redeemed for the underlying asset and held withen this
-    contract until distributed.
+    contract as a budget to pay refunds from.
 """
 from vyper.interfaces import ERC20
 
@@ -57,10 +58,18 @@ event UpdateCustomFeeConfig:
     strategy: address
     custom_config: Fee
 
+event UpdateVaultDefaultConfig:
+    vault: address
+    default_config: Fee
+
 event DistributeRewards:
     token: address
     rewards: uint256
 
+event UpdateRefundBudget:
+    asset: address
+    refund_budget: uint256
+
 ### ENUMS ###
 
 enum ChangeType:
@@ -72,6 +81,8 @@ enum ChangeType:
 # Struct that holds all needed amounts to charge fees
 # and issue refunds. All amounts are expressed in Basis points.
 # i.e. 10_000 == 100%.
+# NOTE: Fee configs are stored packed into a single uint256 so
+#   they can be loaded with one SLOAD. See `_pack_fee`.
 struct Fee:
     # Annual management fee to charge on strategy debt.
     management_fee: uint16
@@ -99,6 +110,35 @@ MAX_BPS: constant(uint256) = 10_000
 #       365.2425 * 86400 = 31556952.0
 SECS_PER_YEAR: constant(uint256) = 31_556_952  # 365.2425 days
 
+# Bit offsets of each value in a packed Fee config.
+PERFORMANCE_FEE_OFFSET: constant(int128) = 16
+REFUND_RATIO_OFFSET: constant(int128) = 32
+MAX_FEE_OFFSET: constant(int128) = 48
+CUSTOM_OFFSET: constant(int128) = 64
+# Used to read a single uint16 value out of a packed Fee config.
+UINT16_MODULUS: constant(uint256) = 65_536
+
+# Bit offset of the added flag in a packed vault.
+VAULT_ADDED_OFFSET: constant(int128) = 72
+# Bit offset of the flag marking a vault default config as set.
+VAULT_DEFAULT_OFFSET: constant(int128) = 73
+# Bit offset of the cached asset in a packed vault.
+ASSET_OFFSET: constant(int128) = 96
+# Used to read the packed Fee config out of a packed vault.
+VAULT_FEE_MODULUS: constant(uint256) = 4_722_366_482_869_645_213_696
+# Used to read the packed Fee config and flags out of a packed vault.
+VAULT_FLAGS_MODULUS: constant(uint256) = 79_228_162_514_264_337_593_543_950_336
+
+# Bit offset of the refund total in packed vault totals.
+REFUNDS_TOTAL_OFFSET: constant(int128) = 128
+# Used to read the fee total out of packed vault totals.
+UINT128_MODULUS: constant(uint256) = 340_282_366_920_938_463_463_374_607_431_768_211_456
+# Totals are capped instead of overflowing.
+MAX_UINT128: constant(uint256) = 340_282_366_920_938_463_463_374_607_431_768_211_455
+
+# Max amount of items that can be handled in one batch call.
+MAX_BATCH_SIZE: constant(uint256) = 100
+
 
 ### STORAGE ###
 
@@ -109,12 +149,23 @@ future_fee_manager: public(address)
 # Address to distribute the accumulated fees to.
 fee_recipient: public(address)
 
-# Mapping of vaults that this serves as an accountant for.
-vaults: public(HashMap[address, bool])
-# Default config to use unless a custom one is set.
-default_config: public(Fee)
-# Mapping vault => strategy => custom Fee config
-fees: public(HashMap[address, HashMap[address, Fee]])
+# Mapping of vaults that this serves as an accountant for to a packed
+# word holding the vaults default Fee config in the lowest 72 bits, if
+# the vault has been added at bit 72, if its default config is set at
+# bit 73 and the vaults asset in the highest 160 bits. So `report` can check the vault, load its default config and
+# get its asset with one SLOAD.
+packed_vaults: HashMap[address, uint256]
+# Packed default config to use unless a custom one is set.
+packed_default_config: uint256
+# Mapping vault => strategy => packed custom Fee config
+packed_fees: HashMap[address, HashMap[address, uint256]]
+# Mapping vault => lifetime fees charged in the lowest 128 bits and
+# lifetime refunds given in the highest 128 bits.
+packed_totals: HashMap[address, uint256]
+# Mapping token => total amount ever distributed to the fee recipient.
+total_distributed: public(HashMap[address, uint256])
+# Mapping asset => amount held to pay refunds with.
+refund_budget: public(HashMap[address, uint256])
 
 @external
 def __init__(
@@ -143,15 +194,16 @@ def __init__(
     self.fee_recipient = fee_recipient
 
     # Set the default fee config
-    self.default_config = Fee({
+    config: Fee = Fee({
         management_fee: default_management,
         performance_fee: default_performance,
         refund_ratio: default_refund,
         max_fee: default_max,
         custom: False
     })
+    self.packed_default_config = self._pack_fee(config)
 
-    log UpdateDefaultFeeConfig(self.default_config)
+    log UpdateDefaultFeeConfig(config)
 
 
 @external
@@ -161,29 +213,95 @@ def report(strategy: address, gain: uint256, loss: uint256) -> (uint256, uint256
         will charge fees based on the gain or loss the strategy is reporting.
     @dev Can only be called by a vault that has been added to this accountant.
         Will default to the default_config for all amounts unless a custom config
-        has been set for a specific strategy.
+        has been set for the specific strategy or a default for its vault.
     @param strategy The strategy that is reporting.
     @param gain The profit the strategy is reporting if any.
     @param loss The loss the strategy is reporting if any.
     """
-    # Make sure this is a valid vault.
-    assert self.vaults[msg.sender], "!authorized"
+    # Load the vault and make sure it is valid.
+    packed_vault: uint256 = self.packed_vaults[msg.sender]
+    assert self._is_added(packed_vault), "!authorized"
 
-    # Load the custom config to check the `custom` flag.
-    # This should just be one slot.
-    fee: Fee = self.fees[msg.sender][strategy]
+    total_fees: uint256 = 0
+    total_refunds: uint256 = 0
+    asset: address = empty(address)
+    total_fees, total_refunds, asset = self._assess_fees(msg.sender, packed_vault, strategy, gain, loss)
 
-    # If not use the default.
-    if not fee.custom:
-        fee = self.default_config
+    if total_refunds > 0:
+        # Reserve the refund out of the budget.
+        self.refund_budget[asset] -= total_refunds
+        # Approve the vault to pull the underlying asset.
+        self.erc20_safe_approve(asset, msg.sender, total_refunds)
+
+    if total_fees > 0 or total_refunds > 0:
+        self._accrue_totals(msg.sender, total_fees, total_refunds)
+
+    return (total_fees, total_refunds)
+
+
+@internal
+def _accrue_totals(vault: address, fees: uint256, refunds: uint256):
+    """
+    @notice Add to the lifetime fee and refund totals of a vault.
+    @dev Both totals share one slot and saturate at max uint128.
+    @param vault The vault that reported.
+    @param fees The fees charged.
+    @param refunds The refunds given.
+    """
+    packed: uint256 = self.packed_totals[vault]
+
+    fees_total: uint256 = self._saturating_add(packed % UINT128_MODULUS, fees)
+    refunds_total: uint256 = self._saturating_add(
+        shift(packed, -REFUNDS_TOTAL_OFFSET), refunds
+    )
+
+    self.packed_totals[vault] = fees_total + shift(refunds_total, REFUNDS_TOTAL_OFFSET)
+
+
+@pure
+@internal
+def _saturating_add(total: uint256, amount: uint256) -> uint256:
+    """
+    @notice Add `amount` to a uint128 `total` capping it at max uint128.
+    """
+    if amount >= MAX_UINT128 - total:
+        return MAX_UINT128
+
+    return total + amount
+
+
+@view
+@internal
+def _assess_fees(
+    vault: address, 
+    packed_vault: uint256,
+    strategy: address, 
+    gain: uint256, 
+    loss: uint256
+) -> (uint256, uint256, address):
+    """
+    @notice Calculate the fees and refunds for a report.
+    @dev Shared by `report` and the preview views so they always match.
+    @param vault The vault the strategy is reporting through.
+    @param packed_vault The packed vault data for `vault`.
+    @param strategy The strategy that is reporting.
+    @param gain The profit the strategy is reporting if any.
+    @param loss The loss the strategy is reporting if any.
+    @return The total fees, total refunds and the asset refunds are
+        paid in, which is only set if there are refunds.
+    """
+    # Load the config to use for this strategy.
+    fee: Fee = self._get_config(vault, packed_vault, strategy)
 
     total_fees: uint256 = 0
     total_refunds: uint256 = 0
+    asset: address = empty(address)
 
-    # Charge management fees no matter gain or loss.
-    if fee.management_fee > 0:
+    # Charge management fees no matter gain or loss. Unless there is
+    # no gain and a max fee, since the fees would be clamped to 0 anyway.
+    if fee.management_fee > 0 and (gain > 0 or fee.max_fee == 0):
         # Retrieve the strategies params from the vault.
-        strategy_params: StrategyParams = IVault(msg.sender).strategies(strategy)
+        strategy_params: StrategyParams = IVault(vault).strategies(strategy)
         # Time since last harvest.
         duration: uint256 = block.timestamp - strategy_params.last_report
         # management_fee is an annual amount, so charge based on the time passed.
@@ -201,23 +319,202 @@ def report(strategy: address, gain: uint256, loss: uint256) -> (uint256, uint256
     else:
         # Means we should have a loss.
         if fee.refund_ratio > 0:
-            # Cache the underlying asset the vault uses.
-            asset: address = IVault(msg.sender).asset()
-            # Give back either all we have or based on refund ratio.
-            total_refunds = min(loss * convert(fee.refund_ratio, uint256) / MAX_BPS, ERC20(asset).balanceOf(self))
-
-            if total_refunds > 0:
-                # Approve the vault to pull the underlying asset.
-                self.erc20_safe_approve(asset, msg.sender, total_refunds)
+            # Use the asset cached when the vault was added.
+            asset = self._unpack_asset(packed_vault)
+            # Only previews can get here for a vault that was never added.
+            if asset == empty(address):
+                asset = IVault(vault).asset()
+            # Give back either all the budget or based on refund ratio.
+            total_refunds = min(loss * convert(fee.refund_ratio, uint256) / MAX_BPS, self.refund_budget[asset])
     
     # 0 Max fee means it is not enforced.
     if fee.max_fee > 0:
         # Ensure fee does not exceed more than the max_fee %.
         total_fees = min(gain * convert(fee.max_fee, uint256) / MAX_BPS, total_fees)
 
+    return (total_fees, total_refunds, asset)
+
+
+@view
+@external
+def preview_report(
+    vault: address, 
+    strategy: address, 
+    gain: uint256, 
+    loss: uint256
+) -> (uint256, uint256):
+    """
+    @notice Get the fees and refunds `report` would return if `vault`
+        reported `gain` or `loss` for `strategy` right now.
+    @dev Uses the same math as `report` but does not check that the vault
+        has been added, so it can be used before adding a vault.
+    @param vault The vault the strategy is reporting through.
+    @param strategy The strategy that would report.
+    @param gain The profit the strategy would report if any.
+    @param loss The loss the strategy would report if any.
+    @return The total fees and total refunds.
+    """
+    total_fees: uint256 = 0
+    total_refunds: uint256 = 0
+    asset: address = empty(address)
+    total_fees, total_refunds, asset = self._assess_fees(vault, self.packed_vaults[vault], strategy, gain, loss)
+
     return (total_fees, total_refunds)
 
 
+@view
+@external
+def preview_reports(
+    vaults: DynArray[address, MAX_BATCH_SIZE],
+    strategies: DynArray[address, MAX_BATCH_SIZE],
+    gains: DynArray[uint256, MAX_BATCH_SIZE],
+    losses: DynArray[uint256, MAX_BATCH_SIZE]
+) -> (DynArray[uint256, MAX_BATCH_SIZE], DynArray[uint256, MAX_BATCH_SIZE]):
+    """
+    @notice Preview many reports at once. See `preview_report`.
+    @dev Every report is previewed against the current state, so refunds
+        from the same asset do not reduce each other.
+    @param vaults The vault each strategy reports through.
+    @param strategies The strategies that would report.
+    @param gains The profit each strategy would report.
+    @param losses The loss each strategy would report.
+    @return The total fees and total refunds of each report.
+    """
+    assert len(vaults) == len(strategies), "length mismatch"
+    assert len(vaults) == len(gains), "length mismatch"
+    assert len(vaults) == len(losses), "length mismatch"
+
+    all_fees: DynArray[uint256, MAX_BATCH_SIZE] = []
+    all_refunds: DynArray[uint256, MAX_BATCH_SIZE] = []
+    total_fees: uint256 = 0
+    total_refunds: uint256 = 0
+    asset: address = empty(address)
+
+    for i in range(MAX_BATCH_SIZE):
+        if i == len(vaults):
+            break
+
+        total_fees, total_refunds, asset = self._assess_fees(
+            vaults[i], self.packed_vaults[vaults[i]], strategies[i], gains[i], losses[i]
+        )
+        all_fees.append(total_fees)
+        all_refunds.append(total_refunds)
+
+    return (all_fees, all_refunds)
+
+
+@view
+@internal
+def _get_config(vault: address, packed_vault: uint256, strategy: address) -> Fee:
+    """
+    @notice Get the fee config to use for a specific strategy.
+    @dev Loads the packed custom config first, which is one slot, then
+        falls back to the vaults default, which is already loaded, and
+        only loads the packed default config if neither is set.
+    @param vault The vault the strategy is hooked up to.
+    @param packed_vault The packed vault data for `vault`.
+    @param strategy The strategy to get the config for.
+    @return The fee config to use.
+    """
+    fee: Fee = self._unpack_fee(self.packed_fees[vault][strategy])
+
+    # If not custom use the vaults default.
+    if not fee.custom:
+        if self._has_vault_default(packed_vault):
+            # Only the lowest bits are read so the flags are ignored.
+            fee = self._unpack_fee(packed_vault)
+        else:
+            # If the vault has no default use the global default.
+            fee = self._unpack_fee(self.packed_default_config)
+
+    return fee
+
+
+@pure
+@internal
+def _is_added(packed_vault: uint256) -> bool:
+    """
+    @notice Read the added flag out of a packed vault.
+    @param packed_vault The packed vault data.
+    @return If the vault has been added.
+    """
+    return shift(packed_vault, -VAULT_ADDED_OFFSET) % 2 == 1
+
+
+@pure
+@internal
+def _has_vault_default(packed_vault: uint256) -> bool:
+    """
+    @notice Read the vault default flag out of a packed vault.
+    @param packed_vault The packed vault data.
+    @return If the vault has a default config set.
+    """
+    return shift(packed_vault, -VAULT_DEFAULT_OFFSET) % 2 == 1
+
+
+@pure
+@internal
+def _unpack_asset(packed_vault: uint256) -> address:
+    """
+    @notice Read the cached asset out of a packed vault.
+    @param packed_vault The packed vault data.
+    @return The vaults asset, empty if the vault was never added.
+    """
+    return convert(shift(packed_vault, -ASSET_OFFSET), address)
+
+
+@view
+@internal
+def _vault_asset(vault: address) -> address:
+    """
+    @notice Get the asset of a vault, using the cached one if it is set.
+    @param vault The vault to get the asset for.
+    @return The vaults asset.
+    """
+    asset: address = self._unpack_asset(self.packed_vaults[vault])
+
+    if asset == empty(address):
+        asset = IVault(vault).asset()
+
+    return asset
+
+
+@pure
+@internal
+def _pack_fee(fee: Fee) -> uint256:
+    """
+    @notice Pack a Fee config into a single word.
+    @dev Each uint16 gets 16 bits starting with the management fee in
+        the lowest bits, followed by the `custom` flag.
+    @param fee The fee config to pack.
+    @return The packed fee config.
+    """
+    return (
+        convert(fee.management_fee, uint256)
+        + shift(convert(fee.performance_fee, uint256), PERFORMANCE_FEE_OFFSET)
+        + shift(convert(fee.refund_ratio, uint256), REFUND_RATIO_OFFSET)
+        + shift(convert(fee.max_fee, uint256), MAX_FEE_OFFSET)
+        + shift(convert(fee.custom, uint256), CUSTOM_OFFSET)
+    )
+
+
+@pure
+@internal
+def _unpack_fee(packed: uint256) -> Fee:
+    """
+    @notice Unpack a Fee config packed with `_pack_fee`.
+    @param packed The packed fee config.
+    @return The unpacked fee config.
+    """
+    return Fee({
+        management_fee: convert(packed % UINT16_MODULUS, uint16),
+        performance_fee: convert(shift(packed, -PERFORMANCE_FEE_OFFSET) % UINT16_MODULUS, uint16),
+        refund_ratio: convert(shift(packed, -REFUND_RATIO_OFFSET) % UINT16_MODULUS, uint16),
+        max_fee: convert(shift(packed, -MAX_FEE_OFFSET) % UINT16_MODULUS, uint16),
+        custom: shift(packed, -CUSTOM_OFFSET) % 2 == 1
+    })
+
+
 @internal
 def erc20_safe_approve(token: address, spender: address, amount: uint256):
     # Used only to send tokens that are not the type managed by this Vault.
@@ -244,9 +541,32 @@ def add_vault(vault: address):
     @param vault The address of a vault to allow to use this accountant.
     """
     assert msg.sender == self.fee_manager, "not fee manager"
-    assert not self.vaults[vault], "already added"
+    self._add_vault(vault)
+
+
+@external
+def add_vaults(vaults: DynArray[address, MAX_BATCH_SIZE]):
+    """
+    @notice Add multiple new vaults for this accountant to charge fees for.
+    @param vaults The addresses of the vaults to allow to use this accountant.
+    """
+    assert msg.sender == self.fee_manager, "not fee manager"
 
-    self.vaults[vault] = True
+    for vault in vaults:
+        self._add_vault(vault)
+
+
+@internal
+def _add_vault(vault: address):
+    packed_vault: uint256 = self.packed_vaults[vault]
+    assert not self._is_added(packed_vault), "already added"
+
+    # Keep any vault default config, set the flag and cache the asset.
+    self.packed_vaults[vault] = (
+        packed_vault % VAULT_FLAGS_MODULUS
+        + shift(1, VAULT_ADDED_OFFSET)
+        + shift(convert(IVault(vault).asset(), uint256), ASSET_OFFSET)
+    )
 
     log VaultChanged(vault, ChangeType.ADDED)
 
@@ -258,9 +578,11 @@ def remove_vault(vault: address):
     @param vault The address of a vault to allow to use this accountant.
     """
     assert msg.sender == self.fee_manager, "not fee manager"
-    assert self.vaults[vault], "not added"
+    packed_vault: uint256 = self.packed_vaults[vault]
+    assert self._is_added(packed_vault), "not added"
 
-    self.vaults[vault] = False
+    # Only clear the flag so any vault default config is kept.
+    self.packed_vaults[vault] = packed_vault - shift(1, VAULT_ADDED_OFFSET)
 
     log VaultChanged(vault, ChangeType.REMOVED)
 
@@ -283,15 +605,16 @@ def update_default_config(
     assert default_management <= self._management_fee_threshold(), "exceeds management fee threshold"
     assert default_performance <= self._performance_fee_threshold(), "exceeds performance fee threshold"
 
-    self.default_config = Fee({
+    config: Fee = Fee({
         management_fee: default_management,
         performance_fee: default_performance,
         refund_ratio: default_refund,
         max_fee: default_max,
         custom: False
     })
+    self.packed_default_config = self._pack_fee(config)
 
-    log UpdateDefaultFeeConfig(self.default_config)
+    log UpdateDefaultFeeConfig(config)
 
 
 @external
@@ -315,20 +638,75 @@ def set_custom_config(
     @param custom_max Custom max fee to allow as a percent of gain.
     """
     assert msg.sender == self.fee_manager, "not fee manager"
-    assert self.vaults[vault], "vault not added"
+    assert self._is_added(self.packed_vaults[vault]), "vault not added"
+
+    self._set_custom_config(
+        vault,
+        strategy,
+        custom_management,
+        custom_performance,
+        custom_refund,
+        custom_max
+    )
+
+
+@external
+def set_custom_configs(
+    vault: address,
+    strategies: DynArray[address, MAX_BATCH_SIZE],
+    custom_configs: DynArray[Fee, MAX_BATCH_SIZE]
+):
+    """
+    @notice Used to set custom fee amounts for multiple strategies
+        in a specific vault.
+    @dev Setting this will cause the default config to be overridden.
+        The `custom` flag of each config is ignored and always set.
+    @param vault The vault the strategies are hooked up to.
+    @param strategies The strategies to customize.
+    @param custom_configs The custom config for each strategy.
+    """
+    assert msg.sender == self.fee_manager, "not fee manager"
+    assert self._is_added(self.packed_vaults[vault]), "vault not added"
+    assert len(strategies) == len(custom_configs), "length mismatch"
+
+    for i in range(MAX_BATCH_SIZE):
+        if i == len(strategies):
+            break
+
+        config: Fee = custom_configs[i]
+        self._set_custom_config(
+            vault,
+            strategies[i],
+            config.management_fee,
+            config.performance_fee,
+            config.refund_ratio,
+            config.max_fee
+        )
+
+
+@internal
+def _set_custom_config(
+    vault: address,
+    strategy: address,
+    custom_management: uint16, 
+    custom_performance: uint16, 
+    custom_refund: uint16, 
+    custom_max: uint16
+):
     assert custom_management <= self._management_fee_threshold(), "exceeds management fee threshold"
     assert custom_performance <= self._performance_fee_threshold(), "exceeds performance fee threshold"
 
     # Set this strategies custom config.
-    self.fees[vault][strategy] = Fee({
+    custom_config: Fee = Fee({
         management_fee: custom_management,
         performance_fee: custom_performance,
         refund_ratio: custom_refund,
         max_fee: custom_max,
         custom: True
     })
+    self.packed_fees[vault][strategy] = self._pack_fee(custom_config)
 
-    log UpdateCustomFeeConfig(vault, strategy, self.fees[vault][strategy])
+    log UpdateCustomFeeConfig(vault, strategy, custom_config)
 
 
 @external
@@ -338,19 +716,98 @@ def remove_custom_config(vault: address, strategy: address):
     @param strategy The strategy to remove custom setting for.
     """
     assert msg.sender == self.fee_manager, "not fee manager"
-    assert self.fees[vault][strategy].custom, "No custom fees set"
+    self._remove_custom_config(vault, strategy)
+
+
+@external
+def remove_custom_configs(vault: address, strategies: DynArray[address, MAX_BATCH_SIZE]):
+    """
+    @notice Removes previously set custom configs for multiple strategies.
+    @param vault The vault the strategies are hooked up to.
+    @param strategies The strategies to remove custom settings for.
+    """
+    assert msg.sender == self.fee_manager, "not fee manager"
+
+    for strategy in strategies:
+        self._remove_custom_config(vault, strategy)
+
+
+@internal
+def _remove_custom_config(vault: address, strategy: address):
+    assert self._unpack_fee(self.packed_fees[vault][strategy]).custom, "No custom fees set"
 
     # Set all the strategies custom fees to 0.
-    self.fees[vault][strategy] = Fee({
-        management_fee: 0,
-        performance_fee: 0,
-        refund_ratio: 0,
-        max_fee: 0,
+    self.packed_fees[vault][strategy] = 0
+
+    # Emit relevant event.
+    log UpdateCustomFeeConfig(vault, strategy, empty(Fee))
+
+
+@external
+def set_vault_default_config(
+    vault: address,
+    vault_management: uint16, 
+    vault_performance: uint16, 
+    vault_refund: uint16, 
+    vault_max: uint16
+):
+    """
+    @notice Used to set a default fee config for every strategy of a
+        specific vault.
+    @dev This overrides the global default config for the vault but
+        strategies with a custom config will still use their own. The
+        config is stored with `custom` unset, that is only used for
+        per strategy configs.
+    @param vault The vault to set the default for.
+    @param vault_management Vault annual management fee to charge.
+    @param vault_performance Vault performance fee to charge.
+    @param vault_refund Vault refund ratio to give back on losses.
+    @param vault_max Vault max fee to allow as a percent of gain.
+    """
+    assert msg.sender == self.fee_manager, "not fee manager"
+    packed_vault: uint256 = self.packed_vaults[vault]
+    assert self._is_added(packed_vault), "vault not added"
+    assert vault_management <= self._management_fee_threshold(), "exceeds management fee threshold"
+    assert vault_performance <= self._performance_fee_threshold(), "exceeds performance fee threshold"
+
+    config: Fee = Fee({
+        management_fee: vault_management,
+        performance_fee: vault_performance,
+        refund_ratio: vault_refund,
+        max_fee: vault_max,
         custom: False
     })
 
-    # Emit relevant event.
-    log UpdateCustomFeeConfig(vault, strategy, self.fees[vault][strategy])
+    # Replace the config while keeping the rest of the packed vault.
+    packed_vault = packed_vault - packed_vault % VAULT_FEE_MODULUS + self._pack_fee(config)
+
+    # Mark the vault default as set.
+    if not self._has_vault_default(packed_vault):
+        packed_vault += shift(1, VAULT_DEFAULT_OFFSET)
+
+    self.packed_vaults[vault] = packed_vault
+
+    log UpdateVaultDefaultConfig(vault, config)
+
+
+@external
+def remove_vault_default_config(vault: address):
+    """
+    @notice Removes a previously set vault default config so the vault
+        will use the global default config again.
+    @param vault The vault to remove the default for.
+    """
+    assert msg.sender == self.fee_manager, "not fee manager"
+    packed_vault: uint256 = self.packed_vaults[vault]
+    assert self._has_vault_default(packed_vault), "No vault default set"
+
+    self.packed_vaults[vault] = (
+        packed_vault 
+        - packed_vault % VAULT_FEE_MODULUS 
+        - shift(1, VAULT_DEFAULT_OFFSET)
+    )
+
+    log UpdateVaultDefaultConfig(vault, empty(Fee))
 
 
 @external
@@ -361,11 +818,92 @@ def withdraw_underlying(vault: address, amount: uint256):
     @dev Refunds are payed in the underlying but fees are charged in the vaults
         token. So management may want to fee some funds to allow for refunds to 
         work across all vaults of the same underlying.
+
+        The withdrawn amount is added to the refund budget of the asset.
     @param vault The vault to redeem from.
     @param amount The amount in the underlying to withdraw.
     """
     assert msg.sender == self.fee_manager, "not fee manager"
+    self._withdraw_underlying(vault, amount)
+
+
+@external
+def withdraw_underlying_many(
+    vaults: DynArray[address, MAX_BATCH_SIZE], 
+    amounts: DynArray[uint256, MAX_BATCH_SIZE]
+) -> DynArray[uint256, MAX_BATCH_SIZE]:
+    """
+    @notice Withdraw the underlying asset from multiple vaults at once.
+    @dev Each withdrawn amount is added to the refund budget of its asset.
+    @param vaults The vaults to redeem from.
+    @param amounts The amount in the underlying to withdraw from each vault.
+    @return The amount of the underlying withdrawn from each vault.
+    """
+    assert msg.sender == self.fee_manager, "not fee manager"
+    assert len(vaults) == len(amounts), "length mismatch"
+
+    withdrawn: DynArray[uint256, MAX_BATCH_SIZE] = []
+    for i in range(MAX_BATCH_SIZE):
+        if i == len(vaults):
+            break
+
+        withdrawn.append(self._withdraw_underlying(vaults[i], amounts[i]))
+
+    return withdrawn
+
+
+@internal
+def _withdraw_underlying(vault: address, amount: uint256) -> uint256:
+    asset: address = self._vault_asset(vault)
+
+    # Use what was actually received for the refund budget.
+    balance: uint256 = ERC20(asset).balanceOf(self)
     IVault(vault).withdraw(amount, self, self)
+    withdrawn: uint256 = ERC20(asset).balanceOf(self) - balance
+
+    self._increase_refund_budget(asset, withdrawn)
+
+    return withdrawn
+
+
+@external
+def fund_refunds(asset: address, amount: uint256):
+    """
+    @notice Add to the refund budget of an asset by sending it in.
+    @dev Anyone can fund refunds. The caller needs to have approved
+        this contract to pull `amount` of `asset`.
+    @param asset The asset to fund refunds in.
+    @param amount The amount of `asset` to add to the budget.
+    """
+    self._erc20_safe_transfer_from(asset, msg.sender, self, amount)
+
+    self._increase_refund_budget(asset, amount)
+
+
+@external
+def release_refund_budget(asset: address, amount: uint256):
+    """
+    @notice Release part of the refund budget of an asset so it can be
+        distributed to the fee recipient.
+    @param asset The asset to release the budget of.
+    @param amount The amount of the budget to release.
+    """
+    assert msg.sender == self.fee_manager, "not fee manager"
+    budget: uint256 = self.refund_budget[asset]
+    assert amount <= budget, "exceeds refund budget"
+
+    budget -= amount
+    self.refund_budget[asset] = budget
+
+    log UpdateRefundBudget(asset, budget)
+
+
+@internal
+def _increase_refund_budget(asset: address, amount: uint256):
+    budget: uint256 = self.refund_budget[asset] + amount
+    self.refund_budget[asset] = budget
+
+    log UpdateRefundBudget(asset, budget)
 
 
 @external
@@ -373,14 +911,50 @@ def distribute(token: address) -> uint256:
     """
     @notice used to withdraw accumulated fees to the designated recipient.
     @dev This can be used to withdraw the vault tokens or underlying tokens
-        that had previously been withdrawn.
+        that had previously been withdrawn. Any refund budget is kept.
     @param token The token to distribute.
     @return The amount of token distributed.
     """
     assert msg.sender == self.fee_manager, "not fee manager"
 
-    rewards: uint256 = ERC20(token).balanceOf(self)
-    self._erc20_safe_transfer(token, self.fee_recipient, rewards)
+    return self._distribute(token, self.fee_recipient)
+
+
+@external
+def distribute_many(
+    tokens: DynArray[address, MAX_BATCH_SIZE]
+) -> DynArray[uint256, MAX_BATCH_SIZE]:
+    """
+    @notice used to withdraw accumulated fees of multiple tokens to the
+        designated recipient.
+    @param tokens The tokens to distribute.
+    @return The amount of each token distributed.
+    """
+    assert msg.sender == self.fee_manager, "not fee manager"
+
+    # Cache the recipient for the whole batch.
+    recipient: address = self.fee_recipient
+
+    rewards: DynArray[uint256, MAX_BATCH_SIZE] = []
+    for token in tokens:
+        rewards.append(self._distribute(token, recipient))
+
+    return rewards
+
+
+@internal
+def _distribute(token: address, recipient: address) -> uint256:
+    # Leave the refund budget in the contract.
+    balance: uint256 = ERC20(token).balanceOf(self)
+    budget: uint256 = self.refund_budget[token]
+
+    rewards: uint256 = 0
+    if balance > budget:
+        rewards = balance - budget
+
+    self._erc20_safe_transfer(token, recipient, rewards)
+
+    self.total_distributed[token] += rewards
 
     log DistributeRewards(token, rewards)
     return rewards
@@ -403,6 +977,23 @@ def _erc20_safe_transfer(token: address, receiver: address, amount: uint256):
         assert convert(response, bool), "Transfer failed!"
 
 
+@internal
+def _erc20_safe_transfer_from(token: address, sender: address, receiver: address, amount: uint256):
+    # HACK: Used to handle non-compliant tokens like USDT
+    response: Bytes[32] = raw_call(
+        token,
+        concat(
+            method_id("transferFrom(address,address,uint256)"),
+            convert(sender, bytes32),
+            convert(receiver, bytes32),
+            convert(amount, bytes32),
+        ),
+        max_outsize=32,
+    )
+    if len(response) > 0:
+        assert convert(response, bool), "Transfer failed!"
+
+
 @external
 def set_future_fee_manager(future_fee_manager: address):
     """
@@ -444,6 +1035,104 @@ def set_fee_recipient(new_fee_recipient: address):
     log UpdateFeeRecipient(old_fee_recipient, new_fee_recipient)
 
 
+@view
+@external
+def default_config() -> Fee:
+    """
+    @notice Get the default config used for all strategies.
+    @return The default fee config.
+    """
+    return self._unpack_fee(self.packed_default_config)
+
+
+@view
+@external
+def vaults(vault: address) -> bool:
+    """
+    @notice Check if a vault has been added to this accountant.
+    @param vault The vault to check.
+    @return If the vault has been added.
+    """
+    return self._is_added(self.packed_vaults[vault])
+
+
+@view
+@external
+def vault_default_config(vault: address) -> Fee:
+    """
+    @notice Get the default config set for a specific vault.
+    @dev `custom` is always False, use `has_vault_default` to check if
+        a default is set.
+    @param vault The vault to get the default config for.
+    @return The vault default config, all 0's if none is set.
+    """
+    return self._unpack_fee(self.packed_vaults[vault])
+
+
+@view
+@external
+def has_vault_default(vault: address) -> bool:
+    """
+    @notice Check if a vault has a default config set.
+    @param vault The vault to check.
+    @return If the vault has a default config set.
+    """
+    return self._has_vault_default(self.packed_vaults[vault])
+
+
+@view
+@external
+def vault_totals(vault: address) -> (uint256, uint256):
+    """
+    @notice Get the lifetime totals charged and refunded through a vault.
+    @dev Each total is capped at max uint128.
+    @param vault The vault to get the totals for.
+    @return The total fees charged and the total refunds given.
+    """
+    packed: uint256 = self.packed_totals[vault]
+    return (packed % UINT128_MODULUS, shift(packed, -REFUNDS_TOTAL_OFFSET))
+
+
+@view
+@external
+def fees(vault: address, strategy: address) -> Fee:
+    """
+    @notice Get the custom config set for a specific strategy.
+    @param vault The vault the strategy is hooked up to.
+    @param strategy The strategy to get the custom config for.
+    @return The custom fee config, all 0's if none is set.
+    """
+    return self._unpack_fee(self.packed_fees[vault][strategy])
+
+
+@view
+@external
+def get_effective_configs(
+    vaults: DynArray[address, MAX_BATCH_SIZE], 
+    strategies: DynArray[address, MAX_BATCH_SIZE]
+) -> DynArray[Fee, MAX_BATCH_SIZE]:
+    """
+    @notice Get the fee config that would be used for each strategy.
+    @dev Resolves the vault or global default config for any strategy
+        without a custom one, the same way `report` does. `custom` is
+        only True when the strategy has its own custom config, not for
+        the vault or global default.
+    @param vaults The vault each strategy is hooked up to.
+    @param strategies The strategies to get the configs for.
+    @return The fee config used for each strategy.
+    """
+    assert len(vaults) == len(strategies), "length mismatch"
+
+    configs: DynArray[Fee, MAX_BATCH_SIZE] = []
+    for i in range(MAX_BATCH_SIZE):
+        if i == len(vaults):
+            break
+
+        configs.append(self._get_config(vaults[i], self.packed_vaults[vaults[i]], strategies[i]))
+
+    return configs
+
+
 @view
 @external
 def performance_fee_threshold() -> uint16:
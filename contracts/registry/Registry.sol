@@ -33,6 +33,20 @@ contract Registry is Governance {
         uint256 releaseVersion
     );
 
+    event RemovedVault(
+        address indexed vault,
+        address indexed asset,
+        uint256 releaseVersion
+    );
+
+    event RemovedStrategy(
+        address indexed strategy,
+        address indexed asset,
+        uint256 releaseVersion
+    );
+
+    event VaultTagged(address indexed vault, string tag);
+
     // Struct stored for every endorsed vault or strategy for
     // off chain use to easily retreive info.
     struct Info {
@@ -46,6 +60,26 @@ contract Registry is Governance {
         string tag;
     }
 
+    // Where an endorsed vault or strategy sits in its assets arrays.
+    struct Position {
+        // Index in `_endorsedVaults` or `_endorsedStrategies`.
+        uint128 index;
+        // Index in the `ByVersion` array for its release.
+        uint128 versionIndex;
+    }
+
+    // Flattened view of the Registry returned by `getRegistrySnapshot`.
+    // Every array is the same length and index `i` of each describes
+    // the same vault or strategy.
+    struct Snapshot {
+        address[] addresses;
+        address[] assets;
+        uint256[] releaseVersions;
+        uint256[] deploymentTimeStamps;
+        string[] tags;
+        bool[] isStrategy;
+    }
+
     // Custom name for this Registry.
     string public name;
 
@@ -58,6 +92,9 @@ contract Registry is Governance {
     // Mapping to check if a specific `asset` has a vault.
     mapping(address => bool) public assetIsUsed;
 
+    // asset => index in the `assets` array.
+    mapping(address => uint256) internal _assetIndex;
+
     // asset => array of all endorsed vaults.
     mapping(address => address[]) internal _endorsedVaults;
 
@@ -75,6 +112,9 @@ contract Registry is Governance {
     // vault/strategy address => Info stuct.
     mapping(address => Info) public info;
 
+    // vault/strategy address => Position struct.
+    mapping(address => Position) public positions;
+
     /**
      * @param _governance Address to set as owner of the Registry.
      * @param _name The custom string for this custom registry to be called.
@@ -91,6 +131,28 @@ contract Registry is Governance {
         releaseRegistry = _releaseRegistry;
     }
 
+    /**
+     * @notice Initialize a minimal proxy clone of the Registry.
+     * @dev Can only be called once on a clone that has no governance.
+     * The implementation gets its governance through the constructor
+     * so it can never be initialized. Clones will use the same
+     * `releaseRegistry` as the implementation since it is immutable.
+     *
+     * @param _governance Address to set as owner of the Registry.
+     * @param _name The custom string for this custom registry to be called.
+     */
+    function initialize(address _governance, string memory _name) external {
+        require(governance == address(0), "initialized");
+        require(_governance != address(0), "ZERO ADDRESS");
+
+        // Set governance.
+        governance = _governance;
+        emit GovernanceTransferred(address(0), _governance);
+
+        // Set name.
+        name = _name;
+    }
+
     /**
      * @notice Returns the total numer of assets being used as the underlying.
      * @return The amount of assets.
@@ -255,6 +317,264 @@ contract Registry is Governance {
         }
     }
 
+    /**
+     * @notice Check if a vault or strategy is endorsed by this Registry.
+     * @param _addr The address of the vault or strategy.
+     * @return True if `_addr` is endorsed.
+     */
+    function isEndorsed(address _addr) public view returns (bool) {
+        return info[_addr].asset != address(0);
+    }
+
+    /**
+     * @notice Get a bounded slice of the tokens being used.
+     * @param _offset The index in `assets` to start from.
+     * @param _limit The max amount of assets to return.
+     * @return The underlying tokens in the requested range.
+     */
+    function getAssetsPage(
+        uint256 _offset,
+        uint256 _limit
+    ) external view returns (address[] memory) {
+        return _getPage(assets, _offset, _limit);
+    }
+
+    /**
+     * @notice Get a bounded slice of the vaults endorsed for an `_asset`.
+     * @param _asset The underlying token used by the vaults.
+     * @param _offset The index in the endorsed vaults to start from.
+     * @param _limit The max amount of vaults to return.
+     * @return The endorsed vaults in the requested range.
+     */
+    function getEndorsedVaultsPage(
+        address _asset,
+        uint256 _offset,
+        uint256 _limit
+    ) external view returns (address[] memory) {
+        return _getPage(_endorsedVaults[_asset], _offset, _limit);
+    }
+
+    /**
+     * @notice Get a bounded slice of the strategies endorsed for an `_asset`.
+     * @param _asset The underlying token used by the strategies.
+     * @param _offset The index in the endorsed strategies to start from.
+     * @param _limit The max amount of strategies to return.
+     * @return The endorsed strategies in the requested range.
+     */
+    function getEndorsedStrategiesPage(
+        address _asset,
+        uint256 _offset,
+        uint256 _limit
+    ) external view returns (address[] memory) {
+        return _getPage(_endorsedStrategies[_asset], _offset, _limit);
+    }
+
+    /**
+     * @notice Walk all endorsed vaults across every asset in bounded chunks.
+     * @dev Start with a `_cursor` of 0 and keep passing back the returned
+     * `nextCursor` until it is 0, which means the walk is complete.
+     *
+     * This is only meant for off chain viewing and should not be used during any
+     * on chain tx's.
+     *
+     * @param _cursor The position to continue the walk from.
+     * @param _limit The max amount of vaults to return, can not be 0.
+     * @return vaults The endorsed vaults for this chunk.
+     * @return nextCursor The cursor to get the next chunk with.
+     */
+    function getAllEndorsedVaultsPage(
+        uint256 _cursor,
+        uint256 _limit
+    ) external view returns (address[] memory vaults, uint256 nextCursor) {
+        return _getAllPage(_endorsedVaults, _cursor, _limit);
+    }
+
+    /**
+     * @notice Walk all endorsed strategies across every asset in bounded chunks.
+     * @dev Start with a `_cursor` of 0 and keep passing back the returned
+     * `nextCursor` until it is 0, which means the walk is complete.
+     *
+     * This is only meant for off chain viewing and should not be used during any
+     * on chain tx's.
+     *
+     * @param _cursor The position to continue the walk from.
+     * @param _limit The max amount of strategies to return, can not be 0.
+     * @return strategies The endorsed strategies for this chunk.
+     * @return nextCursor The cursor to get the next chunk with.
+     */
+    function getAllEndorsedStrategiesPage(
+        uint256 _cursor,
+        uint256 _limit
+    ) external view returns (address[] memory strategies, uint256 nextCursor) {
+        return _getAllPage(_endorsedStrategies, _cursor, _limit);
+    }
+
+    /**
+     * @notice Get the info for a bounded range of every endorsed vault and
+     * strategy in one call.
+     * @dev The entries are ordered by asset, with each assets vaults
+     * followed by its strategies. A returned length lower than `_limit`
+     * means the end of the Registry has been reached.
+     *
+     * This is only meant for off chain viewing and should not be used during any
+     * on chain tx's.
+     *
+     * @param _offset The position in the flattened list to start from.
+     * @param _limit The max amount of vaults and strategies to return.
+     * @return snapshot The parallel arrays of info for the requested range.
+     */
+    function getRegistrySnapshot(
+        uint256 _offset,
+        uint256 _limit
+    ) external view returns (Snapshot memory snapshot) {
+        uint256 length = assets.length;
+        uint256 total;
+
+        // Only walk the lengths first to size the arrays.
+        for (uint256 i; i < length; ++i) {
+            address _asset = assets[i];
+            total +=
+                _endorsedVaults[_asset].length +
+                _endorsedStrategies[_asset].length;
+        }
+
+        if (_offset >= total) return snapshot;
+
+        // Don't read past the end.
+        if (_limit > total - _offset) _limit = total - _offset;
+
+        snapshot.addresses = new address[](_limit);
+        snapshot.assets = new address[](_limit);
+        snapshot.releaseVersions = new uint256[](_limit);
+        snapshot.deploymentTimeStamps = new uint256[](_limit);
+        snapshot.tags = new string[](_limit);
+        snapshot.isStrategy = new bool[](_limit);
+
+        // Then fill them in.
+        uint256 position;
+        uint256 filled;
+        for (uint256 i; i < length && filled < _limit; ++i) {
+            address _asset = assets[i];
+
+            (position, filled) = _fillSnapshot(
+                snapshot,
+                _endorsedVaults[_asset],
+                false,
+                position,
+                _offset,
+                filled
+            );
+
+            (position, filled) = _fillSnapshot(
+                snapshot,
+                _endorsedStrategies[_asset],
+                true,
+                position,
+                _offset,
+                filled
+            );
+        }
+    }
+
+    function _fillSnapshot(
+        Snapshot memory _snapshot,
+        address[] storage _endorsed,
+        bool _isStrategy,
+        uint256 _position,
+        uint256 _offset,
+        uint256 _filled
+    ) internal view returns (uint256, uint256) {
+        uint256 length = _endorsed.length;
+        uint256 limit = _snapshot.addresses.length;
+
+        // Skip anything before the offset.
+        uint256 index = _offset > _position ? _offset - _position : 0;
+
+        for (; index < length && _filled < limit; ++index) {
+            address _addr = _endorsed[index];
+            Info memory _info = info[_addr];
+
+            _snapshot.addresses[_filled] = _addr;
+            _snapshot.assets[_filled] = _info.asset;
+            _snapshot.releaseVersions[_filled] = _info.releaseVersion;
+            _snapshot.deploymentTimeStamps[_filled] = _info
+                .deploymentTimeStamp;
+            _snapshot.tags[_filled] = _info.tag;
+            _snapshot.isStrategy[_filled] = _isStrategy;
+
+            ++_filled;
+        }
+
+        return (_position + length, _filled);
+    }
+
+    function _getPage(
+        address[] storage _array,
+        uint256 _offset,
+        uint256 _limit
+    ) internal view returns (address[] memory page) {
+        uint256 length = _array.length;
+        if (_offset >= length) return page;
+
+        // Don't read past the end of the array.
+        if (_limit > length - _offset) _limit = length - _offset;
+
+        page = new address[](_limit);
+        for (uint256 i; i < _limit; ++i) {
+            page[i] = _array[_offset + i];
+        }
+    }
+
+    function _getAllPage(
+        mapping(address => address[]) storage _endorsed,
+        uint256 _cursor,
+        uint256 _limit
+    ) internal view returns (address[] memory page, uint256 nextCursor) {
+        // A 0 limit would return a 0 cursor without walking anything.
+        require(_limit > 0, "Registry: zero limit");
+
+        // The cursor holds the asset index in the upper 128 bits
+        // and the index in that assets array in the lower 128 bits.
+        uint256 assetIndex = _cursor >> 128;
+        uint256 index = uint128(_cursor);
+        uint256 count;
+
+        // Only walk the lengths first to size the page and find the next cursor.
+        while (count < _limit && assetIndex < assets.length) {
+            uint256 length = _endorsed[assets[assetIndex]].length;
+            uint256 remaining = length > index ? length - index : 0;
+
+            if (remaining > _limit - count) {
+                index += _limit - count;
+                count = _limit;
+            } else {
+                count += remaining;
+                ++assetIndex;
+                index = 0;
+            }
+        }
+
+        if (assetIndex < assets.length) {
+            nextCursor = (assetIndex << 128) | index;
+        }
+
+        // Then copy the addresses over.
+        page = new address[](count);
+        assetIndex = _cursor >> 128;
+        index = uint128(_cursor);
+        for (uint256 i; i < count; ) {
+            address[] storage endorsed = _endorsed[assets[assetIndex]];
+            if (index < endorsed.length) {
+                page[i] = endorsed[index];
+                ++i;
+                ++index;
+            } else {
+                ++assetIndex;
+                index = 0;
+            }
+        }
+    }
+
     /**
      * @notice
      *    Create a new vault for the given asset using a given release in the
@@ -323,19 +643,269 @@ contract Registry is Governance {
         uint256 _releaseDelta,
         uint256 _deploymentTimestamp
     ) public onlyGovernance {
+        (uint256 releaseTarget, bytes32 apiHash) = _getReleaseTarget(
+            _releaseDelta
+        );
+
+        _endorseVault(_vault, releaseTarget, apiHash, _deploymentTimestamp);
+    }
+
+    /**
+     * @notice Endorse an already deployed vault.
+     * @dev To be used with default values for `_releaseDelta` and
+     * `_deploymentTimestamp`.
+     *
+     * @param _vault Address of the vault to endorse.
+     */
+    function endorseVault(address _vault) external {
+        endorseVault(_vault, 0, 0);
+    }
+
+    /**
+     * @notice
+     *    Adds multiple existing vaults of the same release to the list
+     *    of "endorsed" vaults for their assets.
+     * @dev
+     *    The release and its api version are only resolved once for
+     *    the whole batch.
+     *
+     *    Throws if caller isn't `owner`.
+     *    Throws if the array lengths do not match.
+     *    Throws if no releases are registered yet.
+     *    Throws if any `vault`'s api version does not match the release specified.
+     *    Emits a `NewEndorsedVault` event for each vault.
+     * @param _vaults The vaults that will be endorsed by the Registry.
+     * @param _releaseDelta Specify the number of releases prior to the latest to use as a target.
+     * @param _deploymentTimestamps The timestamps of when each vault was deployed for FE use.
+     */
+    function endorseVaults(
+        address[] calldata _vaults,
+        uint256 _releaseDelta,
+        uint256[] calldata _deploymentTimestamps
+    ) external onlyGovernance {
+        require(
+            _vaults.length == _deploymentTimestamps.length,
+            "Registry: length mismatch"
+        );
+
+        (uint256 releaseTarget, bytes32 apiHash) = _getReleaseTarget(
+            _releaseDelta
+        );
+
+        for (uint256 i; i < _vaults.length; ++i) {
+            _endorseVault(
+                _vaults[i],
+                releaseTarget,
+                apiHash,
+                _deploymentTimestamps[i]
+            );
+        }
+    }
+
+    /**
+     * @notice
+     *    Adds an existing strategy to the list of "endorsed" strategies for that asset.
+     * @dev
+     *    Throws if caller isn't `owner`.
+     *    Throws if no releases are registered yet.
+     *    Throws if `strategies`'s api version does not match the release specified.
+     *    Emits a `NewEndorsedStrategy` event.
+     * @param _strategy The strategy that will be endorsed by the Registry.
+     * @param _releaseDelta Specify the number of releases prior to the latest to use as a target.
+     * @param _deploymentTimestamp The timestamp of when the strategy was deployed for FE use.
+     */
+    function endorseStrategy(
+        address _strategy,
+        uint256 _releaseDelta,
+        uint256 _deploymentTimestamp
+    ) public onlyGovernance {
+        (uint256 releaseTarget, bytes32 apiHash) = _getReleaseTarget(
+            _releaseDelta
+        );
+
+        _endorseStrategy(
+            _strategy,
+            releaseTarget,
+            apiHash,
+            _deploymentTimestamp
+        );
+    }
+
+    /**
+     * @notice Endorse an already deployed strategy.
+     * @dev To be used with default values for `_releaseDelta` and
+     * `_deploymentTimestamp`.
+     *
+     * @param _strategy Address of the strategy to endorse.
+     */
+    function endorseStrategy(address _strategy) external {
+        endorseStrategy(_strategy, 0, 0);
+    }
+
+    /**
+     * @notice
+     *    Adds multiple existing strategies of the same release to the list
+     *    of "endorsed" strategies for their assets.
+     * @dev
+     *    The release and its api version are only resolved once for
+     *    the whole batch.
+     *
+     *    Throws if caller isn't `owner`.
+     *    Throws if the array lengths do not match.
+     *    Throws if no releases are registered yet.
+     *    Throws if any `strategy`'s api version does not match the release specified.
+     *    Emits a `NewEndorsedStrategy` event for each strategy.
+     * @param _strategies The strategies that will be endorsed by the Registry.
+     * @param _releaseDelta Specify the number of releases prior to the latest to use as a target.
+     * @param _deploymentTimestamps The timestamps of when each strategy was deployed for FE use.
+     */
+    function endorseStrategies(
+        address[] calldata _strategies,
+        uint256 _releaseDelta,
+        uint256[] calldata _deploymentTimestamps
+    ) external onlyGovernance {
+        require(
+            _strategies.length == _deploymentTimestamps.length,
+            "Registry: length mismatch"
+        );
+
+        (uint256 releaseTarget, bytes32 apiHash) = _getReleaseTarget(
+            _releaseDelta
+        );
+
+        for (uint256 i; i < _strategies.length; ++i) {
+            _endorseStrategy(
+                _strategies[i],
+                releaseTarget,
+                apiHash,
+                _deploymentTimestamps[i]
+            );
+        }
+    }
+
+    /**
+     * @notice
+     *    Adds an existing vault to the list of "endorsed" vaults for that asset
+     *    under the release matching the vaults own api version.
+     * @dev
+     *    Throws if caller isn't `owner`.
+     *    Throws if the vault's api version has not been released.
+     *    Emits a `NewEndorsedVault` event.
+     * @param _vault The vault that will be endorsed by the Registry.
+     * @param _deploymentTimestamp The timestamp of when the vault was deployed for FE use.
+     */
+    function endorseVaultByApiVersion(
+        address _vault,
+        uint256 _deploymentTimestamp
+    ) external onlyGovernance {
+        _endorseVaultByApiVersion(_vault, _deploymentTimestamp);
+    }
+
+    /**
+     * @notice
+     *    Adds multiple existing vaults to the list of "endorsed" vaults
+     *    for their assets, each under the release matching its api version.
+     * @dev
+     *    The vaults do not need to share a release.
+     *
+     *    Throws if caller isn't `owner`.
+     *    Throws if the array lengths do not match.
+     *    Throws if any vault's api version has not been released.
+     *    Emits a `NewEndorsedVault` event for each vault.
+     * @param _vaults The vaults that will be endorsed by the Registry.
+     * @param _deploymentTimestamps The timestamps of when each vault was deployed for FE use.
+     */
+    function endorseVaultsByApiVersion(
+        address[] calldata _vaults,
+        uint256[] calldata _deploymentTimestamps
+    ) external onlyGovernance {
+        require(
+            _vaults.length == _deploymentTimestamps.length,
+            "Registry: length mismatch"
+        );
+
+        for (uint256 i; i < _vaults.length; ++i) {
+            _endorseVaultByApiVersion(_vaults[i], _deploymentTimestamps[i]);
+        }
+    }
+
+    /**
+     * @notice
+     *    Adds an existing strategy to the list of "endorsed" strategies for
+     *    that asset under the release matching the strategies own api version.
+     * @dev
+     *    Throws if caller isn't `owner`.
+     *    Throws if the strategy's api version has not been released.
+     *    Emits a `NewEndorsedStrategy` event.
+     * @param _strategy The strategy that will be endorsed by the Registry.
+     * @param _deploymentTimestamp The timestamp of when the strategy was deployed for FE use.
+     */
+    function endorseStrategyByApiVersion(
+        address _strategy,
+        uint256 _deploymentTimestamp
+    ) external onlyGovernance {
+        _endorseStrategyByApiVersion(_strategy, _deploymentTimestamp);
+    }
+
+    /**
+     * @notice
+     *    Adds multiple existing strategies to the list of "endorsed" strategies
+     *    for their assets, each under the release matching its api version.
+     * @dev
+     *    The strategies do not need to share a release.
+     *
+     *    Throws if caller isn't `owner`.
+     *    Throws if the array lengths do not match.
+     *    Throws if any strategy's api version has not been released.
+     *    Emits a `NewEndorsedStrategy` event for each strategy.
+     * @param _strategies The strategies that will be endorsed by the Registry.
+     * @param _deploymentTimestamps The timestamps of when each strategy was deployed for FE use.
+     */
+    function endorseStrategiesByApiVersion(
+        address[] calldata _strategies,
+        uint256[] calldata _deploymentTimestamps
+    ) external onlyGovernance {
+        require(
+            _strategies.length == _deploymentTimestamps.length,
+            "Registry: length mismatch"
+        );
+
+        for (uint256 i; i < _strategies.length; ++i) {
+            _endorseStrategyByApiVersion(
+                _strategies[i],
+                _deploymentTimestamps[i]
+            );
+        }
+    }
+
+    /**
+     * @dev Get the release number to use based on the `_releaseDelta`
+     * and the hash of the api version of that release to check against.
+     */
+    function _getReleaseTarget(
+        uint256 _releaseDelta
+    ) internal view returns (uint256 releaseTarget, bytes32 apiHash) {
         // Will underflow if no releases created yet, or targeting prior to release history
-        uint256 releaseTarget = ReleaseRegistry(releaseRegistry).numReleases() -
+        releaseTarget =
+            ReleaseRegistry(releaseRegistry).numReleases() -
             1 -
             _releaseDelta; // dev: no releases
 
-        // Get the API version for the target specified
-        string memory apiVersion = IFactory(
-            ReleaseRegistry(releaseRegistry).factories(releaseTarget)
-        ).api_version();
+        // Get the hash of the API version for the target specified
+        apiHash = ReleaseRegistry(releaseRegistry).releaseApiHash(
+            releaseTarget
+        );
+    }
 
+    function _endorseVault(
+        address _vault,
+        uint256 _releaseTarget,
+        bytes32 _apiHash,
+        uint256 _deploymentTimestamp
+    ) internal {
+        // Make sure the API versions match
         require(
-            keccak256(bytes(IVault(_vault).api_version())) ==
-                keccak256(bytes((apiVersion))),
+            keccak256(bytes(IVault(_vault).api_version())) == _apiHash,
             "Wrong API Version"
         );
 
@@ -343,20 +913,26 @@ contract Registry is Governance {
         _registerVault(
             _vault,
             IVault(_vault).asset(),
-            releaseTarget,
+            _releaseTarget,
             _deploymentTimestamp
         );
     }
 
-    /**
-     * @notice Endorse an already deployed vault.
-     * @dev To be used with default values for `_releaseDelta` and
-     * `_deploymentTimestamp`.
-     *
-     * @param _vault Address of the vault to endorse.
-     */
-    function endorseVault(address _vault) external {
-        endorseVault(_vault, 0, 0);
+    function _endorseVaultByApiVersion(
+        address _vault,
+        uint256 _deploymentTimestamp
+    ) internal {
+        // Resolve the release straight from the vaults api version.
+        uint256 _releaseTarget = ReleaseRegistry(releaseRegistry).releaseIdOf(
+            IVault(_vault).api_version()
+        );
+
+        _registerVault(
+            _vault,
+            IVault(_vault).asset(),
+            _releaseTarget,
+            _deploymentTimestamp
+        );
     }
 
     function _registerVault(
@@ -365,6 +941,16 @@ contract Registry is Governance {
         uint256 _releaseTarget,
         uint256 _deploymentTimestamp
     ) internal {
+        require(!isEndorsed(_vault), "Already Endorsed");
+
+        // Store where the vault will sit in each array.
+        positions[_vault] = Position({
+            index: uint128(_endorsedVaults[_asset].length),
+            versionIndex: uint128(
+                _endorsedVaultsByVersion[_asset][_releaseTarget].length
+            )
+        });
+
         // Add to the endorsed vaults arrays.
         _endorsedVaults[_asset].push(_vault);
         _endorsedVaultsByVersion[_asset][_releaseTarget].push(_vault);
@@ -377,51 +963,63 @@ contract Registry is Governance {
             tag: ""
         });
 
-        if (!assetIsUsed[_asset]) {
-            // We have a new asset to add
-            assets.push(_asset);
-            assetIsUsed[_asset] = true;
-        }
+        _addAsset(_asset);
 
         emit NewEndorsedVault(_vault, _asset, _releaseTarget);
     }
 
-    /**
-     * @notice
-     *    Adds an existing strategy to the list of "endorsed" strategies for that asset.
-     * @dev
-     *    Throws if caller isn't `owner`.
-     *    Throws if no releases are registered yet.
-     *    Throws if `strategies`'s api version does not match the release specified.
-     *    Emits a `NewEndorsedStrategy` event.
-     * @param _strategy The strategy that will be endorsed by the Registry.
-     * @param _releaseDelta Specify the number of releases prior to the latest to use as a target.
-     * @param _deploymentTimestamp The timestamp of when the strategy was deployed for FE use.
-     */
-    function endorseStrategy(
+    function _endorseStrategy(
         address _strategy,
-        uint256 _releaseDelta,
+        uint256 _releaseTarget,
+        bytes32 _apiHash,
         uint256 _deploymentTimestamp
-    ) public onlyGovernance {
-        // Will underflow if no releases created yet, or targeting prior to release history
-        uint256 _releaseTarget = ReleaseRegistry(releaseRegistry)
-            .numReleases() -
-            1 -
-            _releaseDelta; // dev: no releases
-
-        // Get the API version for this release
-        string memory apiVersion = IFactory(
-            ReleaseRegistry(releaseRegistry).factories(_releaseTarget)
-        ).api_version();
-
+    ) internal {
         // Make sure the API versions match
         require(
-            keccak256(bytes((IStrategy(_strategy).apiVersion()))) ==
-                keccak256(bytes((apiVersion))),
+            keccak256(bytes((IStrategy(_strategy).apiVersion()))) == _apiHash,
             "Wrong API Version"
         );
 
-        address _asset = IStrategy(_strategy).asset();
+        _registerStrategy(
+            _strategy,
+            IStrategy(_strategy).asset(),
+            _releaseTarget,
+            _deploymentTimestamp
+        );
+    }
+
+    function _endorseStrategyByApiVersion(
+        address _strategy,
+        uint256 _deploymentTimestamp
+    ) internal {
+        // Resolve the release straight from the strategies api version.
+        uint256 _releaseTarget = ReleaseRegistry(releaseRegistry).releaseIdOf(
+            IStrategy(_strategy).apiVersion()
+        );
+
+        _registerStrategy(
+            _strategy,
+            IStrategy(_strategy).asset(),
+            _releaseTarget,
+            _deploymentTimestamp
+        );
+    }
+
+    function _registerStrategy(
+        address _strategy,
+        address _asset,
+        uint256 _releaseTarget,
+        uint256 _deploymentTimestamp
+    ) internal {
+        require(!isEndorsed(_strategy), "Already Endorsed");
+
+        // Store where the strategy will sit in each array.
+        positions[_strategy] = Position({
+            index: uint128(_endorsedStrategies[_asset].length),
+            versionIndex: uint128(
+                _endorsedStrategiesByVersion[_asset][_releaseTarget].length
+            )
+        });
 
         _endorsedStrategies[_asset].push(_strategy);
         _endorsedStrategiesByVersion[_asset][_releaseTarget].push(_strategy);
@@ -433,24 +1031,140 @@ contract Registry is Governance {
             tag: ""
         });
 
+        _addAsset(_asset);
+
+        emit NewEndorsedStrategy(_strategy, _asset, _releaseTarget);
+    }
+
+    function _addAsset(address _asset) internal {
         if (!assetIsUsed[_asset]) {
             // We have a new asset to add
+            _assetIndex[_asset] = assets.length;
             assets.push(_asset);
             assetIsUsed[_asset] = true;
         }
+    }
 
-        emit NewEndorsedStrategy(_strategy, _asset, _releaseTarget);
+    /**
+     * @notice Remove a vault from the Registry.
+     * @dev Moves the last vault into the removed vaults place in each
+     * array so the order of the remaining vaults may change.
+     *
+     *   If the asset has no vaults or strategies left it will be removed
+     *   from `assets` as well.
+     *
+     *   Emits a `RemovedVault` event.
+     *
+     * @param _vault The vault to remove.
+     */
+    function removeVault(address _vault) external onlyGovernance {
+        address _asset = info[_vault].asset;
+        Position memory _position = positions[_vault];
+        address[] storage _vaults = _endorsedVaults[_asset];
+
+        require(
+            _position.index < _vaults.length &&
+                _vaults[_position.index] == _vault,
+            "!Endorsed"
+        );
+
+        uint256 _releaseVersion = info[_vault].releaseVersion;
+
+        _removeFromArray(_vaults, _position.index, false);
+        _removeFromArray(
+            _endorsedVaultsByVersion[_asset][_releaseVersion],
+            _position.versionIndex,
+            true
+        );
+
+        delete positions[_vault];
+        delete info[_vault];
+
+        _removeAssetIfUnused(_asset);
+
+        emit RemovedVault(_vault, _asset, _releaseVersion);
     }
 
     /**
-     * @notice Endorse an already deployed strategy.
-     * @dev To be used with default values for `_releaseDelta` and
-     * `_deploymentTimestamp`.
+     * @notice Remove a strategy from the Registry.
+     * @dev Moves the last strategy into the removed strategies place in
+     * each array so the order of the remaining strategies may change.
      *
-     * @param _strategy Address of the strategy to endorse.
+     *   If the asset has no vaults or strategies left it will be removed
+     *   from `assets` as well.
+     *
+     *   Emits a `RemovedStrategy` event.
+     *
+     * @param _strategy The strategy to remove.
      */
-    function endorseStrategy(address _strategy) external {
-        endorseStrategy(_strategy, 0, 0);
+    function removeStrategy(address _strategy) external onlyGovernance {
+        address _asset = info[_strategy].asset;
+        Position memory _position = positions[_strategy];
+        address[] storage _strategies = _endorsedStrategies[_asset];
+
+        require(
+            _position.index < _strategies.length &&
+                _strategies[_position.index] == _strategy,
+            "!Endorsed"
+        );
+
+        uint256 _releaseVersion = info[_strategy].releaseVersion;
+
+        _removeFromArray(_strategies, _position.index, false);
+        _removeFromArray(
+            _endorsedStrategiesByVersion[_asset][_releaseVersion],
+            _position.versionIndex,
+            true
+        );
+
+        delete positions[_strategy];
+        delete info[_strategy];
+
+        _removeAssetIfUnused(_asset);
+
+        emit RemovedStrategy(_strategy, _asset, _releaseVersion);
+    }
+
+    function _removeFromArray(
+        address[] storage _array,
+        uint256 _index,
+        bool _isVersionArray
+    ) internal {
+        uint256 _last = _array.length - 1;
+
+        // Move the last element into the removed ones place.
+        if (_index != _last) {
+            address _moved = _array[_last];
+            _array[_index] = _moved;
+
+            if (_isVersionArray) {
+                positions[_moved].versionIndex = uint128(_index);
+            } else {
+                positions[_moved].index = uint128(_index);
+            }
+        }
+
+        _array.pop();
+    }
+
+    function _removeAssetIfUnused(address _asset) internal {
+        if (
+            _endorsedVaults[_asset].length != 0 ||
+            _endorsedStrategies[_asset].length != 0
+        ) return;
+
+        uint256 _index = _assetIndex[_asset];
+        uint256 _last = assets.length - 1;
+
+        if (_index != _last) {
+            address _moved = assets[_last];
+            assets[_index] = _moved;
+            _assetIndex[_moved] = _index;
+        }
+
+        assets.pop();
+        delete _assetIndex[_asset];
+        assetIsUsed[_asset] = false;
     }
 
     /**
@@ -459,6 +1173,8 @@ contract Registry is Governance {
      * on chain if desired to arbitrarily classify any vaults.
      *   i.e. Certain credit ratings ("AAA") / Vault status ("Shutdown") etc.
      *
+     *   Emits a `VaultTagged` event.
+     *
      * @param _vault Address of the vault or strategy to tag.
      * @param _tag The string to tag the vault or strategy with.
      */
@@ -466,7 +1182,32 @@ contract Registry is Governance {
         address _vault,
         string memory _tag
     ) external onlyGovernance {
-        require(info[_vault].asset != address(0), "!Endorsed");
+        _tagVault(_vault, _tag);
+    }
+
+    /**
+     * @notice Tag multiple vaults or strategies in one transaction.
+     * @dev Each `_vaults[i]` will be tagged with `_tags[i]`.
+     *   Emits a `VaultTagged` event for each vault.
+     *
+     * @param _vaults Addresses of the vaults or strategies to tag.
+     * @param _tags The strings to tag each vault or strategy with.
+     */
+    function tagVaults(
+        address[] calldata _vaults,
+        string[] calldata _tags
+    ) external onlyGovernance {
+        require(_vaults.length == _tags.length, "Registry: length mismatch");
+
+        for (uint256 i; i < _vaults.length; ++i) {
+            _tagVault(_vaults[i], _tags[i]);
+        }
+    }
+
+    function _tagVault(address _vault, string memory _tag) internal {
+        require(isEndorsed(_vault), "!Endorsed");
         info[_vault].tag = _tag;
+
+        emit VaultTagged(_vault, _tag);
     }
 }
@@ -1,6 +1,8 @@
 // SPDX-License-Identifier: GPL-3.0
 pragma solidity 0.8.18;
 
+import {Clones} from "@openzeppelin/contracts/proxy/Clones.sol";
+
 import {Registry} from "./Registry.sol";
 
 contract RegistryFactory {
@@ -12,8 +14,20 @@ contract RegistryFactory {
 
     address public immutable releaseRegistry;
 
+    // Registry used as the implementation for all minimal proxy clones.
+    address public immutable registryImplementation;
+
     constructor(address _releaseRegistry) {
         releaseRegistry = _releaseRegistry;
+
+        // Governed by this factory so it can never be initialized.
+        registryImplementation = address(
+            new Registry(
+                address(this),
+                "Registry Implementation",
+                _releaseRegistry
+            )
+        );
     }
 
     function name() external pure returns (string memory) {
@@ -37,4 +51,96 @@ contract RegistryFactory {
         emit NewRegistry(address(newRegistry), _governance, _name);
         return address(newRegistry);
     }
+
+    /**
+     * @notice Deploy a new Registry as an EIP-1167 minimal proxy.
+     * @dev Much cheaper to deploy than `createNewRegistry` but every
+     * call to the new Registry will pay for the extra delegatecall.
+     *
+     * @param _name The custom string for the new registry to be called.
+     * @return The address of the new Registry.
+     */
+    function cloneNewRegistry(string memory _name) external returns (address) {
+        return cloneNewRegistry(msg.sender, _name);
+    }
+
+    /**
+     * @notice Deploy a new Registry as an EIP-1167 minimal proxy.
+     * @dev Much cheaper to deploy than `createNewRegistry` but every
+     * call to the new Registry will pay for the extra delegatecall.
+     *
+     * @param _governance Address to set as owner of the new Registry.
+     * @param _name The custom string for the new registry to be called.
+     * @return The address of the new Registry.
+     */
+    function cloneNewRegistry(
+        address _governance,
+        string memory _name
+    ) public returns (address) {
+        address newRegistry = Clones.clone(registryImplementation);
+
+        _initializeClone(newRegistry, _governance, _name);
+        return newRegistry;
+    }
+
+    /**
+     * @notice Deploy a new Registry as an EIP-1167 minimal proxy to a
+     * deterministic address using CREATE2.
+     * @dev The salt is combined with `_governance` so the address can't
+     * be taken by a clone with a different owner.
+     *
+     * Throws if a Registry was already deployed with the same salt.
+     *
+     * @param _governance Address to set as owner of the new Registry.
+     * @param _name The custom string for the new registry to be called.
+     * @param _salt The salt to use for CREATE2.
+     * @return The address of the new Registry.
+     */
+    function cloneNewRegistry(
+        address _governance,
+        string memory _name,
+        bytes32 _salt
+    ) external returns (address) {
+        address newRegistry = Clones.cloneDeterministic(
+            registryImplementation,
+            _getSalt(_governance, _salt)
+        );
+
+        _initializeClone(newRegistry, _governance, _name);
+        return newRegistry;
+    }
+
+    /**
+     * @notice Get the address a deterministic clone will be deployed to.
+     * @param _governance Address that will be the owner of the new Registry.
+     * @param _salt The salt that will be used for CREATE2.
+     * @return The address of the future Registry.
+     */
+    function predictRegistryAddress(
+        address _governance,
+        bytes32 _salt
+    ) external view returns (address) {
+        return
+            Clones.predictDeterministicAddress(
+                registryImplementation,
+                _getSalt(_governance, _salt)
+            );
+    }
+
+    function _initializeClone(
+        address _newRegistry,
+        address _governance,
+        string memory _name
+    ) internal {
+        Registry(_newRegistry).initialize(_governance, _name);
+
+        emit NewRegistry(_newRegistry, _governance, _name);
+    }
+
+    function _getSalt(
+        address _governance,
+        bytes32 _salt
+    ) internal pure returns (bytes32) {
+        return keccak256(abi.encodePacked(_governance, _salt));
+    }
 }
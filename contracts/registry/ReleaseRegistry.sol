@@ -25,6 +25,12 @@ contract ReleaseRegistry is Governance {
     // place in the order it was released.
     mapping(string => uint256) public releaseTargets;
 
+    // Mapping of release id to the hash of its API version.
+    mapping(uint256 => bytes32) public releaseApiHash;
+
+    // Mapping of release id to its API version.
+    mapping(uint256 => string) public releaseApiVersion;
+
     constructor(address _governance) Governance(_governance) {}
 
     /**
@@ -42,13 +48,41 @@ contract ReleaseRegistry is Governance {
      * @return The api version of the latest release.
      */
     function latestRelease() external view returns (string memory) {
-        return IFactory(factories[numReleases - 1]).api_version(); // dev: no release
+        return releaseApiVersion[numReleases - 1]; // dev: no release
+    }
+
+    /**
+     * @notice Check if an api version has been released.
+     * @dev Unlike `releaseTargets` this can tell an unknown api
+     * version apart from release 0.
+     * @param _apiVersion The api version to check.
+     * @return True if `_apiVersion` has a release.
+     */
+    function isRelease(string memory _apiVersion) public view returns (bool) {
+        return
+            releaseApiHash[releaseTargets[_apiVersion]] ==
+            keccak256(bytes(_apiVersion));
+    }
+
+    /**
+     * @notice Get the release id for an api version.
+     * @dev Throws if the api version has not been released.
+     * @param _apiVersion The api version to look up.
+     * @return The release id of `_apiVersion`.
+     */
+    function releaseIdOf(
+        string memory _apiVersion
+    ) external view returns (uint256) {
+        require(isRelease(_apiVersion), "ReleaseRegistry: unknown release");
+        return releaseTargets[_apiVersion];
     }
 
     /**
      * @notice Issue a new release using a deployed factory.
      * @dev Stores the factory address in `factories` and the release
      * target in `releaseTargests` with its associated API version.
+     * The API version and its hash are also stored by release id so
+     * they can be read without calling the factory again.
      *
      *   Throws if caller isn't `governance`.
      *   Throws if the api version is the same as the previous release.
@@ -61,13 +95,12 @@ contract ReleaseRegistry is Governance {
         uint256 releaseId = numReleases;
 
         string memory apiVersion = IFactory(_factory).api_version();
+        bytes32 apiHash = keccak256(bytes(apiVersion));
 
         if (releaseId > 0) {
             // Make sure this isnt the same as the last one
             require(
-                keccak256(
-                    bytes(IFactory(factories[releaseId - 1]).api_version())
-                ) != keccak256(bytes(apiVersion)),
+                releaseApiHash[releaseId - 1] != apiHash,
                 "ReleaseRegistry: same api version"
             );
         }
@@ -75,6 +108,10 @@ contract ReleaseRegistry is Governance {
         // Update latest release.
         factories[releaseId] = _factory;
 
+        // Cache the api version for this release.
+        releaseApiHash[releaseId] = apiHash;
+        releaseApiVersion[releaseId] = apiVersion;
+
         // Set the api to the target.
         releaseTargets[apiVersion] = releaseId;
 
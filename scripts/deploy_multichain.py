@@ -0,0 +1,224 @@
+"""
+Deploy the ReleaseRegistry and RegistryFactory to many chains at once.
+
+Uses the same CREATE2 deployment as `deploy_registry.py` so the contracts
+end up at the same addresses on every chain. Each network is deployed to
+from its own thread with its own provider connection, and the results are
+written to a json manifest after every step. Running again with the same
+manifest will resume and only retry what is still missing.
+
+Networks are passed as comma separated `name=rpc_url` pairs:
+
+    DEPLOY_NETWORKS="local1=http://127.0.0.1:8545,local2=http://127.0.0.1:8546" \\
+    DEPLOY_SENDER=0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266 \\
+    GOVERNANCE=0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266 \\
+    ape run deploy_multichain
+
+Set DEPLOYER_PRIVATE_KEY to sign the transactions locally, otherwise
+DEPLOY_SENDER needs to be an unlocked account on every node, i.e. a local
+hardhat or anvil instance. Set DEPLOYER_CONTRACT to use a different CREATE2
+Deployer, i.e. a `Deployer` mock deployed to the local nodes.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from web3 import Web3, HTTPProvider
+from eth_account import Account
+import json
+import os
+import sys
+import threading
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from deploy_registry import (
+    DEPLOYER_CONTRACT,
+    SALT_STRING,
+    get_salt,
+    precompute_addresses,
+)
+
+DEPLOYER_ABI = [
+    {
+        "inputs": [
+            {"name": "code", "type": "bytes"},
+            {"name": "salt", "type": "uint256"},
+        ],
+        "name": "deploy",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    }
+]
+
+
+def load_manifest(manifest_path):
+    if not os.path.exists(manifest_path):
+        return {}
+
+    with open(manifest_path) as f:
+        return json.load(f)
+
+
+def save_manifest(manifest_path, manifest):
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def send_deploy(w3, deployer_contract, init_code, salt, sender, private_key):
+    deploy = w3.eth.contract(
+        address=deployer_contract, abi=DEPLOYER_ABI
+    ).functions.deploy(init_code, salt)
+
+    if private_key is not None:
+        account = Account.from_key(private_key)
+        tx = deploy.build_transaction(
+            {
+                "from": account.address,
+                "nonce": w3.eth.get_transaction_count(account.address),
+            }
+        )
+        tx_hash = w3.eth.send_raw_transaction(
+            account.sign_transaction(tx).rawTransaction
+        )
+    else:
+        tx_hash = deploy.transact({"from": sender})
+
+    return w3.eth.wait_for_transaction_receipt(tx_hash)
+
+
+def deploy_to_network(
+    name,
+    rpc_url,
+    contracts,
+    salt,
+    deployer_contract,
+    sender,
+    private_key,
+    manifest,
+    manifest_path,
+    lock,
+):
+    # One provider connection per network.
+    w3 = Web3(HTTPProvider(rpc_url))
+
+    with lock:
+        record = manifest["networks"].setdefault(name, {})
+        record["rpc_url"] = rpc_url
+        record.pop("error", None)
+
+    try:
+        chain_id = w3.eth.chain_id
+
+        with lock:
+            record["chain_id"] = chain_id
+
+        for contract_name, (address, init_code) in contracts.items():
+            if record.get(contract_name, {}).get("address") == address:
+                print(f"[{name}] {contract_name} already in manifest")
+                continue
+
+            if len(w3.eth.get_code(address)) > 0:
+                print(f"[{name}] {contract_name} already deployed to {address}")
+                result = {"address": address, "tx_hash": None, "gas_used": 0}
+            else:
+                print(f"[{name}] Deploying {contract_name}...")
+                receipt = send_deploy(
+                    w3, deployer_contract, init_code, salt, sender, private_key
+                )
+                assert receipt.status == 1, f"deploy reverted {receipt.transactionHash}"
+                assert len(w3.eth.get_code(address)) > 0, f"nothing at {address}"
+
+                result = {
+                    "address": address,
+                    "tx_hash": receipt.transactionHash.hex(),
+                    "gas_used": receipt.gasUsed,
+                }
+                print(f"[{name}] Deployed {contract_name} to {address}")
+
+            with lock:
+                record[contract_name] = result
+                save_manifest(manifest_path, manifest)
+
+    except Exception as e:
+        print(f"[{name}] Failed: {e!r}")
+        with lock:
+            record["error"] = repr(e)
+            save_manifest(manifest_path, manifest)
+
+
+def deploy_all(
+    networks,
+    governance,
+    sender=None,
+    private_key=None,
+    salt_string=SALT_STRING,
+    deployer_contract=DEPLOYER_CONTRACT,
+    manifest_path="deployments.json",
+    max_workers=None,
+):
+    """
+    Deploy to every network in `networks`, a dict of name => rpc url,
+    concurrently and return the resulting manifest.
+    """
+    assert sender is not None or private_key is not None, "no sender"
+
+    salt = get_salt(salt_string)
+
+    # The addresses are the same on every chain so only compute them once.
+    contracts = precompute_addresses(governance, salt, deployer_contract)
+
+    manifest = load_manifest(manifest_path)
+    # Make sure we are resuming the same deployment.
+    if manifest:
+        assert manifest["salt_string"] == salt_string, "different salt"
+        assert manifest["governance"] == governance, "different governance"
+        assert manifest["deployer"] == deployer_contract, "different deployer"
+
+    manifest["salt_string"] = salt_string
+    manifest["governance"] = governance
+    manifest["deployer"] = deployer_contract
+    manifest.setdefault("networks", {})
+
+    lock = threading.Lock()
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(networks)) as executor:
+        for name, rpc_url in networks.items():
+            executor.submit(
+                deploy_to_network,
+                name,
+                rpc_url,
+                contracts,
+                salt,
+                deployer_contract,
+                sender,
+                private_key,
+                manifest,
+                manifest_path,
+                lock,
+            )
+
+    with lock:
+        save_manifest(manifest_path, manifest)
+
+    failed = [n for n in networks if "error" in manifest["networks"][n]]
+    if failed:
+        print(f"Failed on {failed}, run again to resume.")
+
+    return manifest
+
+
+def main():
+    networks = dict(
+        network.split("=", 1)
+        for network in os.environ["DEPLOY_NETWORKS"].split(",")
+        if network
+    )
+
+    deploy_all(
+        networks,
+        os.environ["GOVERNANCE"],
+        sender=os.getenv("DEPLOY_SENDER"),
+        private_key=os.getenv("DEPLOYER_PRIVATE_KEY"),
+        salt_string=os.getenv("SALT_STRING", SALT_STRING),
+        deployer_contract=os.getenv("DEPLOYER_CONTRACT", DEPLOYER_CONTRACT),
+        manifest_path=os.getenv("DEPLOY_MANIFEST", "deployments.json"),
+    )
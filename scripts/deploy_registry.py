@@ -6,25 +6,11 @@ import os
 import hashlib
 from copy import deepcopy
 
+DEPLOYER_CONTRACT = "0x488E1A80133870CB71EE2b08f926CE329d56B084"
+SALT_STRING = "v3.0.1-beta"
 
-def deploy_release_and_factory():
-    print("Deploying Vault Registry on ChainID", chain.chain_id)
-    publish_flag = True
-    # if chain.chain_id == 1:
-    #    publish_flag = True
-
-    if input("Do you want to continue? ") == "n":
-        return
-
-    release_registry = project.ReleaseRegistry
-    factory = project.RegistryFactory
-    deployer = accounts.load("v3_deployer")
-    deployer_contract = project.Deployer.at(
-        "0x488E1A80133870CB71EE2b08f926CE329d56B084"
-    )
-
-    salt_string = "v3.0.1-beta"
 
+def get_salt(salt_string=SALT_STRING):
     # Create a SHA-256 hash object
     hash_object = hashlib.sha256()
     # Update the hash object with the string data
@@ -32,51 +18,115 @@ def deploy_release_and_factory():
     # Get the hexadecimal representation of the hash
     hex_hash = hash_object.hexdigest()
     # Convert the hexadecimal hash to an integer
-    salt = int(hex_hash, 16)
+    return int(hex_hash, 16)
+
+
+def compute_create2_address(deployer, salt, init_code):
+    """
+    Compute the address `deployer` will deploy `init_code` to with CREATE2.
+    """
+    return Web3.to_checksum_address(
+        Web3.keccak(
+            b"\xff"
+            + HexBytes(deployer)
+            + salt.to_bytes(32, "big")
+            + Web3.keccak(HexBytes(init_code))
+        )[12:]
+    )
 
-    print(f"Salt we are using {salt}")
-    print("Init balance:", deployer.balance / 1e18)
 
-    # generate and deploy release registry
-    release_constructor = release_registry.constructor.encode_input("GOV")
+def get_release_init_code(governance):
+    release_registry = project.ReleaseRegistry
+    release_constructor = release_registry.constructor.encode_input(governance)
 
-    release_deploy_bytecode = HexBytes(
+    return HexBytes(
         HexBytes(release_registry.contract_type.deployment_bytecode.bytecode)
         + release_constructor
     )
 
-    print(f"Deploying Release Registry...")
 
-    release_tx = deployer_contract.deploy(
-        release_deploy_bytecode, salt, sender=deployer
+def get_factory_init_code(release_address):
+    factory = project.RegistryFactory
+    factory_constructor = factory.constructor.encode_input(release_address)
+
+    return HexBytes(
+        HexBytes(factory.contract_type.deployment_bytecode.bytecode)
+        + factory_constructor
     )
 
-    release_event = list(release_tx.decode_logs(deployer_contract.Deployed))
 
-    release_address = release_event[0].addr
+def precompute_addresses(governance, salt, deployer=DEPLOYER_CONTRACT):
+    """
+    Compute the ReleaseRegistry and RegistryFactory addresses fully offline.
 
-    print(f"Deployed the vault release to {release_address}")
+    The factory takes the release registry address in its constructor,
+    so its address depends on the precomputed release registry address.
+    """
+    release_init_code = get_release_init_code(governance)
+    release_address = compute_create2_address(deployer, salt, release_init_code)
 
-    # deploy factory
-    print(f"Deploying factory...")
+    factory_init_code = get_factory_init_code(release_address)
+    factory_address = compute_create2_address(deployer, salt, factory_init_code)
 
-    factory_constructor = factory.constructor.encode_input(release_address)
+    return {
+        "release_registry": (release_address, release_init_code),
+        "registry_factory": (factory_address, factory_init_code),
+    }
 
-    factory_deploy_bytecode = HexBytes(
-        HexBytes(factory.contract_type.deployment_bytecode.bytecode)
-        + factory_constructor
-    )
 
-    factory_tx = deployer_contract.deploy(
-        factory_deploy_bytecode, salt, sender=deployer
-    )
+def is_deployed(address):
+    return len(chain.provider.get_code(address)) > 0
+
+
+def deploy_release_and_factory(
+    governance="GOV", salt_string=SALT_STRING, dry_run=False, interactive=True
+):
+    print("Deploying Vault Registry on ChainID", chain.chain_id)
+    publish_flag = True
+    # if chain.chain_id == 1:
+    #    publish_flag = True
 
-    factory_event = list(factory_tx.decode_logs(deployer_contract.Deployed))
+    if interactive and input("Do you want to continue? ") == "n":
+        return
 
-    deployed_factory = factory.at(factory_event[0].addr)
+    deployer = accounts.load("v3_deployer")
+    deployer_contract = project.Deployer.at(DEPLOYER_CONTRACT)
 
-    print(f"Deployed Rgistry Factory to {deployed_factory.address}")
+    salt = get_salt(salt_string)
+
+    print(f"Salt we are using {salt}")
+    print("Init balance:", deployer.balance / 1e18)
+
+    addresses = precompute_addresses(governance, salt, deployer_contract.address)
+
+    for name, (address, init_code) in addresses.items():
+        if is_deployed(address):
+            print(f"Skipping {name}, already deployed to {address}")
+            continue
+
+        if dry_run:
+            gas = deployer_contract.deploy.estimate_gas_cost(
+                init_code, salt, sender=deployer
+            )
+            print(f"Would deploy {name} to {address} using {gas} gas")
+            continue
+
+        print(f"Deploying {name}...")
+
+        tx = deployer_contract.deploy(init_code, salt, sender=deployer)
+
+        event = list(tx.decode_logs(deployer_contract.Deployed))
+
+        assert event[0].addr == address, f"{name} deployed to {event[0].addr}"
+
+        print(f"Deployed {name} to {address}")
+
+    return {name: address for name, (address, _) in addresses.items()}
 
 
 def main():
-    deploy_release_and_factory()
+    deploy_release_and_factory(
+        governance=os.getenv("GOVERNANCE", "GOV"),
+        dry_run=os.getenv("DRY_RUN", "false").lower() == "true",
+        interactive=os.getenv("NO_PROMPT", "false").lower() != "true",
+    )
@@ -0,0 +1,146 @@
+"""
+Pure Python simulation of `GenericAccountant.report`.
+
+Mirrors the contracts math with uint256 semantics so fees can be sized
+for thousands of strategies without a node. Every intermediate value is
+checked against the uint256 range and an `OverflowError` is raised where
+the contract would revert.
+
+    from fee_simulator import Fee, simulate_reports
+
+    fees, refunds = simulate_reports(
+        Fee(100, 1_000, 0, 0),
+        current_debts=[10**24, 5 * 10**23],
+        durations=[86_400, 7 * 86_400],
+        gains=[10**21, 0],
+        losses=[0, 10**20],
+    )
+"""
+from collections import namedtuple
+
+MAX_BPS = 10_000
+SECS_PER_YEAR = 31_556_952
+MAX_UINT256 = 2**256 - 1
+MAX_UINT16 = 2**16 - 1
+
+Fee = namedtuple(
+    "Fee",
+    ["management_fee", "performance_fee", "refund_ratio", "max_fee", "custom"],
+    defaults=[False],
+)
+
+
+def _check_uint(value, max_value=MAX_UINT256, name="value"):
+    if not isinstance(value, int) or value < 0 or value > max_value:
+        raise ValueError(f"{name} {value!r} is not in range [0, {max_value}]")
+
+    return value
+
+
+def _mul(a, b):
+    result = a * b
+
+    if result > MAX_UINT256:
+        raise OverflowError(f"{a} * {b} overflows uint256")
+
+    return result
+
+
+def simulate_report(fee, current_debt, duration, gain, loss, refund_budget=None):
+    """
+    Simulate a single `report` call.
+
+    `fee` is the config the accountant would resolve for the strategy,
+    `current_debt` the strategies debt in the vault and `duration` the
+    seconds since its last report. `refund_budget` is the accountants
+    `refund_budget` for the vaults asset, None meaning no limit.
+
+    Returns the (total_fees, total_refunds) the contract would return.
+    """
+    fee = Fee(*fee)
+    for name, value in zip(Fee._fields[:4], fee[:4]):
+        _check_uint(value, MAX_UINT16, name)
+
+    for name, value in [
+        ("current_debt", current_debt),
+        ("duration", duration),
+        ("gain", gain),
+        ("loss", loss),
+    ]:
+        _check_uint(value, name=name)
+
+    if refund_budget is not None:
+        _check_uint(refund_budget, name="refund_budget")
+
+    total_fees = 0
+    total_refunds = 0
+
+    # Management fees are skipped with no gain and a max fee.
+    if fee.management_fee > 0 and (gain > 0 or fee.max_fee == 0):
+        total_fees = (
+            _mul(_mul(current_debt, duration), fee.management_fee)
+            // MAX_BPS
+            // SECS_PER_YEAR
+        )
+
+    if gain > 0:
+        total_fees += _mul(gain, fee.performance_fee) // MAX_BPS
+        if total_fees > MAX_UINT256:
+            raise OverflowError("total fees overflow uint256")
+    elif fee.refund_ratio > 0:
+        total_refunds = _mul(loss, fee.refund_ratio) // MAX_BPS
+        if refund_budget is not None:
+            total_refunds = min(total_refunds, refund_budget)
+
+    if fee.max_fee > 0:
+        total_fees = min(_mul(gain, fee.max_fee) // MAX_BPS, total_fees)
+
+    return total_fees, total_refunds
+
+
+def _broadcast(values, length, name):
+    if isinstance(values, list):
+        if len(values) != length:
+            raise ValueError(f"{name} has length {len(values)} not {length}")
+        return values
+
+    return [values] * length
+
+
+def simulate_reports(
+    fees, current_debts, durations, gains, losses, refund_budgets=None
+):
+    """
+    Simulate many `report` calls at once.
+
+    Every argument can either be a list, with all lists the same length,
+    or a single value to use for every report. So a single `Fee` is used
+    as the config for every report and a list of them gives one per report.
+
+    Returns two lists with the total fees and total refunds of each report.
+    """
+    length = None
+    for values in [fees, current_debts, durations, gains, losses, refund_budgets]:
+        if isinstance(values, list):
+            length = len(values)
+            break
+
+    if length is None:
+        length = 1
+
+    total_fees = []
+    total_refunds = []
+
+    for report in zip(
+        _broadcast(fees, length, "fees"),
+        _broadcast(current_debts, length, "current_debts"),
+        _broadcast(durations, length, "durations"),
+        _broadcast(gains, length, "gains"),
+        _broadcast(losses, length, "losses"),
+        _broadcast(refund_budgets, length, "refund_budgets"),
+    ):
+        fee, refund = simulate_report(*report)
+        total_fees.append(fee)
+        total_refunds.append(refund)
+
+    return total_fees, total_refunds
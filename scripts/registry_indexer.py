@@ -0,0 +1,379 @@
+"""
+Index a Registry and its ReleaseRegistry into a local SQLite database.
+
+Backfills all `NewEndorsedVault`, `NewEndorsedStrategy`, `RemovedVault`,
+`RemovedStrategy`, `VaultTagged` and `NewRelease` events in block range
+batches and then follows the chain from the last synced block, so
+frontends can query the registry locally instead of making one `info()`
+call per vault on every page load.
+
+    RPC_URL=http://127.0.0.1:8545 \\
+    REGISTRY=0x... \\
+    START_BLOCK=17000000 \\
+    ape run registry_indexer
+
+The last synced block is stored in the database with the events so
+restarting the indexer will pick up where it left off. Only blocks at
+least CONFIRMATIONS, default 12, deep are indexed to stay clear of reorgs.
+"""
+from web3 import Web3, HTTPProvider
+import os
+import sqlite3
+import time
+
+REGISTRY_ABI = [
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "name": "vault", "type": "address"},
+            {"indexed": True, "name": "asset", "type": "address"},
+            {"indexed": False, "name": "releaseVersion", "type": "uint256"},
+        ],
+        "name": "NewEndorsedVault",
+        "type": "event",
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "name": "strategy", "type": "address"},
+            {"indexed": True, "name": "asset", "type": "address"},
+            {"indexed": False, "name": "releaseVersion", "type": "uint256"},
+        ],
+        "name": "NewEndorsedStrategy",
+        "type": "event",
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "name": "vault", "type": "address"},
+            {"indexed": True, "name": "asset", "type": "address"},
+            {"indexed": False, "name": "releaseVersion", "type": "uint256"},
+        ],
+        "name": "RemovedVault",
+        "type": "event",
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "name": "strategy", "type": "address"},
+            {"indexed": True, "name": "asset", "type": "address"},
+            {"indexed": False, "name": "releaseVersion", "type": "uint256"},
+        ],
+        "name": "RemovedStrategy",
+        "type": "event",
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "name": "vault", "type": "address"},
+            {"indexed": False, "name": "tag", "type": "string"},
+        ],
+        "name": "VaultTagged",
+        "type": "event",
+    },
+    {
+        "inputs": [{"name": "", "type": "address"}],
+        "name": "info",
+        "outputs": [
+            {"name": "asset", "type": "address"},
+            {"name": "releaseVersion", "type": "uint256"},
+            {"name": "deploymentTimeStamp", "type": "uint256"},
+            {"name": "tag", "type": "string"},
+        ],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "releaseRegistry",
+        "outputs": [{"name": "", "type": "address"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+RELEASE_REGISTRY_ABI = [
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "name": "releaseId", "type": "uint256"},
+            {"indexed": True, "name": "factory", "type": "address"},
+            {"indexed": False, "name": "apiVersion", "type": "string"},
+        ],
+        "name": "NewRelease",
+        "type": "event",
+    },
+]
+
+EVENT_SIGNATURES = {
+    "NewEndorsedVault": "NewEndorsedVault(address,address,uint256)",
+    "NewEndorsedStrategy": "NewEndorsedStrategy(address,address,uint256)",
+    "RemovedVault": "RemovedVault(address,address,uint256)",
+    "RemovedStrategy": "RemovedStrategy(address,address,uint256)",
+    "VaultTagged": "VaultTagged(address,string)",
+    "NewRelease": "NewRelease(uint256,address,string)",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS releases (
+    release_id INTEGER PRIMARY KEY,
+    factory TEXT NOT NULL,
+    api_version TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS endorsed (
+    address TEXT PRIMARY KEY,
+    asset TEXT NOT NULL,
+    release_version INTEGER NOT NULL,
+    deployment_timestamp INTEGER NOT NULL,
+    tag TEXT NOT NULL DEFAULT '',
+    is_strategy INTEGER NOT NULL,
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS endorsed_asset ON endorsed (asset);
+CREATE INDEX IF NOT EXISTS endorsed_release ON endorsed (release_version);
+CREATE INDEX IF NOT EXISTS endorsed_tag ON endorsed (tag);
+"""
+
+
+class RegistryIndexer:
+    def __init__(
+        self,
+        w3,
+        registry,
+        db_path="registry.db",
+        release_registry=None,
+        start_block=0,
+        batch_size=2_000,
+        confirmations=12,
+    ):
+        self.w3 = w3
+        self.registry = w3.eth.contract(
+            address=Web3.to_checksum_address(registry), abi=REGISTRY_ABI
+        )
+
+        if release_registry is None:
+            release_registry = self.registry.functions.releaseRegistry().call()
+
+        self.release_registry = w3.eth.contract(
+            address=Web3.to_checksum_address(release_registry),
+            abi=RELEASE_REGISTRY_ABI,
+        )
+
+        self.start_block = start_block
+        self.batch_size = batch_size
+        # Number of blocks to stay behind the head to avoid most reorgs.
+        self.confirmations = confirmations
+
+        self.handlers = {
+            Web3.keccak(text=EVENT_SIGNATURES["NewEndorsedVault"]): (
+                self.registry.events.NewEndorsedVault(),
+                self._handle_new_vault,
+            ),
+            Web3.keccak(text=EVENT_SIGNATURES["NewEndorsedStrategy"]): (
+                self.registry.events.NewEndorsedStrategy(),
+                self._handle_new_strategy,
+            ),
+            Web3.keccak(text=EVENT_SIGNATURES["RemovedVault"]): (
+                self.registry.events.RemovedVault(),
+                self._handle_removed_vault,
+            ),
+            Web3.keccak(text=EVENT_SIGNATURES["RemovedStrategy"]): (
+                self.registry.events.RemovedStrategy(),
+                self._handle_removed_strategy,
+            ),
+            Web3.keccak(text=EVENT_SIGNATURES["VaultTagged"]): (
+                self.registry.events.VaultTagged(),
+                self._handle_vault_tagged,
+            ),
+            Web3.keccak(text=EVENT_SIGNATURES["NewRelease"]): (
+                self.release_registry.events.NewRelease(),
+                self._handle_new_release,
+            ),
+        }
+
+        self.db = sqlite3.connect(db_path)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+
+    @property
+    def last_block(self):
+        row = self.db.execute(
+            "SELECT value FROM meta WHERE key = 'last_block'"
+        ).fetchone()
+        return self.start_block - 1 if row is None else row["value"]
+
+    def sync(self, to_block=None):
+        """
+        Index every event up to `to_block`, defaulting to the latest
+        confirmed block, and return the last block indexed.
+        """
+        if to_block is None:
+            to_block = self.w3.eth.block_number - self.confirmations
+
+        from_block = self.last_block + 1
+
+        while from_block <= to_block:
+            batch_end = min(from_block + self.batch_size - 1, to_block)
+
+            logs = self.w3.eth.get_logs(
+                {
+                    "address": [
+                        self.registry.address,
+                        self.release_registry.address,
+                    ],
+                    "fromBlock": from_block,
+                    "toBlock": batch_end,
+                }
+            )
+
+            # Write the batch and the new cursor in one transaction so a
+            # crash can never leave a partially indexed range behind.
+            with self.db:
+                for log in sorted(
+                    logs, key=lambda log: (log["blockNumber"], log["logIndex"])
+                ):
+                    self._process_log(log)
+
+                self.db.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) "
+                    "VALUES ('last_block', ?)",
+                    (batch_end,),
+                )
+
+            from_block = batch_end + 1
+
+        return self.last_block
+
+    def follow(self, poll_interval=12):
+        """
+        Keep the database in sync with the chain until interrupted.
+        """
+        while True:
+            self.sync()
+            time.sleep(poll_interval)
+
+    def _process_log(self, log):
+        handler = self.handlers.get(log["topics"][0])
+        if handler is None:
+            return
+
+        event, handle = handler
+        handle(event.process_log(log))
+
+    def _handle_new_vault(self, event):
+        self._insert_endorsed(event, event.args.vault, False)
+
+    def _handle_new_strategy(self, event):
+        self._insert_endorsed(event, event.args.strategy, True)
+
+    def _insert_endorsed(self, event, address, is_strategy):
+        # The event does not include the deployment timestamp so read it
+        # once when the vault or strategy is first indexed, at the block of
+        # the event so a backfill doesn't pick up later changes.
+        info = self.registry.functions.info(address).call(
+            block_identifier=event.blockNumber
+        )
+
+        self.db.execute(
+            "INSERT OR REPLACE INTO endorsed VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                address,
+                event.args.asset,
+                event.args.releaseVersion,
+                info[2],
+                info[3],
+                int(is_strategy),
+                event.blockNumber,
+                event.logIndex,
+            ),
+        )
+
+    def _handle_removed_vault(self, event):
+        self.db.execute("DELETE FROM endorsed WHERE address = ?", (event.args.vault,))
+
+    def _handle_removed_strategy(self, event):
+        self.db.execute(
+            "DELETE FROM endorsed WHERE address = ?", (event.args.strategy,)
+        )
+
+    def _handle_vault_tagged(self, event):
+        self.db.execute(
+            "UPDATE endorsed SET tag = ? WHERE address = ?",
+            (event.args.tag, event.args.vault),
+        )
+
+    def _handle_new_release(self, event):
+        self.db.execute(
+            "INSERT OR REPLACE INTO releases VALUES (?, ?, ?)",
+            (event.args.releaseId, event.args.factory, event.args.apiVersion),
+        )
+
+    def _query(self, where="1", params=()):
+        return [
+            dict(row)
+            for row in self.db.execute(
+                f"SELECT endorsed.*, releases.api_version FROM endorsed "
+                f"LEFT JOIN releases "
+                f"ON releases.release_id = endorsed.release_version "
+                f"WHERE {where} ORDER BY block_number, log_index",
+                params,
+            )
+        ]
+
+    def get_assets(self):
+        return [
+            row["asset"]
+            for row in self.db.execute(
+                "SELECT asset FROM endorsed GROUP BY asset "
+                "ORDER BY MIN(block_number * 1000000 + log_index)"
+            )
+        ]
+
+    def get_releases(self):
+        return [
+            dict(row)
+            for row in self.db.execute("SELECT * FROM releases ORDER BY release_id")
+        ]
+
+    def get_vaults(self, asset=None):
+        if asset is None:
+            return self._query("is_strategy = 0")
+
+        return self._query("is_strategy = 0 AND asset = ?", (asset,))
+
+    def get_strategies(self, asset=None):
+        if asset is None:
+            return self._query("is_strategy = 1")
+
+        return self._query("is_strategy = 1 AND asset = ?", (asset,))
+
+    def get_by_release(self, release_version):
+        return self._query("release_version = ?", (release_version,))
+
+    def get_by_api_version(self, api_version):
+        return self._query("api_version = ?", (api_version,))
+
+    def get_by_tag(self, tag):
+        return self._query("tag = ?", (tag,))
+
+    def close(self):
+        self.db.close()
+
+
+def main():
+    w3 = Web3(HTTPProvider(os.environ["RPC_URL"]))
+
+    indexer = RegistryIndexer(
+        w3,
+        os.environ["REGISTRY"],
+        db_path=os.getenv("INDEXER_DB", "registry.db"),
+        start_block=int(os.getenv("START_BLOCK", "0")),
+        confirmations=int(os.getenv("CONFIRMATIONS", "12")),
+    )
+
+    indexer.follow(poll_interval=int(os.getenv("POLL_INTERVAL", "12")))
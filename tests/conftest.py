@@ -1,13 +1,58 @@
 import pytest
 from ape import accounts, project
+from ape import config as ape_config
 from utils.constants import MAX_INT, WEEK, ROLES
-from web3 import Web3, HTTPProvider
+from utils.gas import GasTracker
 from hexbytes import HexBytes
+from itertools import count
 import os
-import time
+import sys
 
-# we default to local node
-w3 = Web3(HTTPProvider(os.getenv("CHAIN_PROVIDER", "http://127.0.0.1:8545")))
+# Make the scripts importable so they can be tested against the local node.
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+# Used to give every new vault a unique name.
+vault_count = count()
+
+
+def pytest_configure(config):
+    # Give every pytest-xdist worker its own local node on its own port
+    # so the tests can be sharded with `ape test -n <workers>`.
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if worker is not None:
+        port = int(os.getenv("HARDHAT_BASE_PORT", 8545)) + int(worker[2:])
+        ape_config.get_config("hardhat").host = f"http://127.0.0.1:{port}"
+
+
+@pytest.fixture(scope="session")
+def w3(chain):
+    # Use the same node as ape's provider.
+    return chain.provider.web3
+
+
+@pytest.fixture(scope="session")
+def session_setup(
+    vault_blueprint,
+    vault_factory,
+    release_registry,
+    registry_factory,
+    registry,
+    accountant,
+    asset,
+    vault,
+    strategy,
+):
+    # Deploy everything expensive once, before the first test that uses
+    # it, so ape's own isolation reverts back to it after every test.
+    # Used by the chain tests only, the pure python tests need no node.
+    yield
+
+
+@pytest.fixture(scope="session")
+def gas_tracker():
+    tracker = GasTracker()
+    yield tracker
+    tracker.write()
 
 
 @pytest.fixture(scope="session")
@@ -59,7 +104,7 @@ def amount():
 
 
 @pytest.fixture(scope="session")
-def vault_blueprint(project, daddy):
+def vault_blueprint(project, daddy, w3):
     blueprint_bytecode = b"\xFE\x71\x00" + HexBytes(
         project.dependencies["yearn-vaults"][
             "master"
@@ -128,8 +173,8 @@ def create_vault(project, daddy, vault_factory):
         vault_name=None,
         vault_symbol="VV3",
     ):
-        vault_suffix = str(int(time.time()))[-4:]
-        vault_name = f"Vault V3 {vault_suffix}"
+        if vault_name is None:
+            vault_name = f"Vault V3 {next(vault_count)}"
 
         tx = vault_factory.deploy_new_vault(
             asset,
@@ -259,6 +304,7 @@ def accountant(deploy_accountant):
 def set_fees_for_strategy():
     def set_fees_for_strategy(
         daddy,
+        vault,
         strategy,
         accountant,
         management_fee,
@@ -266,9 +312,24 @@ def set_fees_for_strategy():
         refund_ratio=0,
         max_fee=0,
     ):
-        accountant.set_management_fee(strategy.address, management_fee, sender=daddy)
-        accountant.set_performance_fee(strategy.address, performance_fee, sender=daddy)
-        accountant.set_refund_ratio(strategy.address, refund_ratio, sender=daddy)
-        accountant.set_max_fee(strategy.address, max_fee, sender=daddy)
+        accountant.set_custom_config(
+            vault.address,
+            strategy.address,
+            management_fee,
+            performance_fee,
+            refund_ratio,
+            max_fee,
+            sender=daddy,
+        )
 
     return set_fees_for_strategy
+
+
+@pytest.fixture(scope="session")
+def fund_refunds(daddy, asset):
+    def fund_refunds(accountant, amount, token=asset):
+        token.mint(daddy, amount, sender=daddy)
+        token.approve(accountant, amount, sender=daddy)
+        accountant.fund_refunds(token, amount, sender=daddy)
+
+    return fund_refunds
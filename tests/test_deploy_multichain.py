@@ -0,0 +1,165 @@
+from ape import project, chain
+from deploy_multichain import deploy_all
+from web3 import Web3, HTTPProvider
+import json
+import os
+import pytest
+import subprocess
+import time
+
+pytestmark = pytest.mark.usefixtures("session_setup")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def second_node():
+    # Start another local node, offset from the per worker nodes, so the
+    # deploys run against two separate chains at once.
+    worker = os.getenv("PYTEST_XDIST_WORKER", "gw0")
+    port = int(os.getenv("HARDHAT_BASE_PORT", 8545)) + 100 + int(worker[2:])
+    uri = f"http://127.0.0.1:{port}"
+
+    process = subprocess.Popen(
+        ["npx", "hardhat", "node", "--port", str(port)],
+        cwd=ROOT_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    w3 = Web3(HTTPProvider(uri))
+    deadline = time.time() + 60
+    while not w3.is_connected():
+        assert process.poll() is None, "second node exited"
+        assert time.time() < deadline, "second node did not start"
+        time.sleep(0.5)
+
+    yield w3
+
+    process.terminate()
+    process.wait()
+
+
+def set_code(w3, address, code):
+    w3.provider.make_request("hardhat_setCode", [address, code])
+
+
+def copy_deployer(w3, deployer):
+    # Put the Deployer at the same address on the second node.
+    set_code(w3, deployer.address, Web3.to_hex(chain.provider.get_code(deployer)))
+
+
+def test__deploy_all(daddy, second_node, tmp_path):
+    deployer = daddy.deploy(project.Deployer)
+    copy_deployer(second_node, deployer)
+
+    manifest_path = str(tmp_path / "deployments.json")
+    networks = {
+        "first": chain.provider.uri,
+        "second": second_node.provider.endpoint_uri,
+    }
+
+    manifest = deploy_all(
+        networks,
+        daddy.address,
+        sender=daddy.address,
+        deployer_contract=deployer.address,
+        manifest_path=manifest_path,
+    )
+
+    first = manifest["networks"]["first"]
+    second = manifest["networks"]["second"]
+
+    assert "error" not in first
+    assert "error" not in second
+    assert first["chain_id"] == chain.chain_id
+    assert second["chain_id"] == second_node.eth.chain_id
+
+    release_registry = project.ReleaseRegistry.at(first["release_registry"]["address"])
+    registry_factory = project.RegistryFactory.at(first["registry_factory"]["address"])
+
+    assert release_registry.governance() == daddy
+    assert registry_factory.releaseRegistry() == release_registry
+
+    # Both chains were deployed to, at the same addresses.
+    for name in ["release_registry", "registry_factory"]:
+        assert first[name]["gas_used"] > 0
+        assert second[name]["gas_used"] > 0
+        assert second[name]["address"] == first[name]["address"]
+        assert len(second_node.eth.get_code(second[name]["address"])) > 0
+
+    with open(manifest_path) as f:
+        assert json.load(f) == manifest
+
+    # Running again finds everything in the manifest.
+    resumed = deploy_all(
+        networks,
+        daddy.address,
+        sender=daddy.address,
+        deployer_contract=deployer.address,
+        manifest_path=manifest_path,
+    )
+
+    assert resumed == manifest
+
+
+def test__deploy_all__resumes_after_failure(daddy, second_node, tmp_path):
+    deployer = daddy.deploy(project.Deployer)
+    # Nothing deployed at the Deployer address on the second node.
+    set_code(second_node, deployer.address, "0x")
+
+    manifest_path = str(tmp_path / "deployments.json")
+    networks = {
+        "first": chain.provider.uri,
+        "second": second_node.provider.endpoint_uri,
+    }
+    # Use a new salt so the second node has nothing from other tests.
+    kwargs = dict(
+        sender=daddy.address,
+        salt_string="resume test",
+        deployer_contract=deployer.address,
+        manifest_path=manifest_path,
+    )
+
+    manifest = deploy_all(networks, daddy.address, **kwargs)
+
+    first = manifest["networks"]["first"]
+
+    assert "error" not in first
+    assert first["release_registry"]["gas_used"] > 0
+    assert "error" in manifest["networks"]["second"]
+    assert "release_registry" not in manifest["networks"]["second"]
+
+    with open(manifest_path) as f:
+        assert json.load(f) == manifest
+
+    copy_deployer(second_node, deployer)
+
+    manifest = deploy_all(networks, daddy.address, **kwargs)
+
+    # Only the failed network is retried.
+    assert manifest["networks"]["first"] == first
+
+    second = manifest["networks"]["second"]
+
+    assert "error" not in second
+    for name in ["release_registry", "registry_factory"]:
+        assert second[name]["address"] == first[name]["address"]
+        assert second[name]["gas_used"] > 0
+        assert len(second_node.eth.get_code(second[name]["address"])) > 0
+
+
+def test__deploy_all__records_failures(daddy, tmp_path):
+    manifest_path = str(tmp_path / "deployments.json")
+
+    # Nothing deployed at the Deployer address so the deploy can't work.
+    manifest = deploy_all(
+        {"broken": chain.provider.uri},
+        daddy.address,
+        sender=daddy.address,
+        deployer_contract=daddy.address,
+        manifest_path=manifest_path,
+    )
+
+    assert "error" in manifest["networks"]["broken"]
+    assert "release_registry" not in manifest["networks"]["broken"]
@@ -0,0 +1,117 @@
+import ape
+from ape import chain
+from fee_simulator import Fee, MAX_UINT256, simulate_report, simulate_reports
+from utils.constants import MAX_BPS, MAX_INT, YEAR
+import pytest
+import random
+
+
+def test_simulate_reports__broadcast():
+    fee = Fee(100, 1_000, 5_000, 0)
+
+    fees, refunds = simulate_reports(
+        fee,
+        current_debts=[10**24, 10**24, 0],
+        durations=YEAR,
+        gains=[10**22, 0, 0],
+        losses=[0, 10**22, 10**22],
+        refund_budgets=[None, None, 10**20],
+    )
+
+    management = 10**24 * YEAR * 100 // MAX_BPS // YEAR
+
+    assert fees == [management + 10**22 * 1_000 // MAX_BPS, management, 0]
+    assert refunds == [0, 10**22 * 5_000 // MAX_BPS, 10**20]
+
+    # A config per report.
+    fees, refunds = simulate_reports(
+        [fee, Fee(0, 0, 0, 0)], 10**24, YEAR, 10**22, 0
+    )
+
+    assert fees[1] == 0
+
+    with pytest.raises(ValueError):
+        simulate_reports([fee], [1, 2], YEAR, 0, 0)
+
+
+def test_simulate_report__bounds():
+    with pytest.raises(ValueError):
+        simulate_report(Fee(2**16, 0, 0, 0), 0, 0, 0, 0)
+
+    with pytest.raises(ValueError):
+        simulate_report(Fee(0, 0, 0, 0), -1, 0, 0, 0)
+
+    with pytest.raises(OverflowError):
+        simulate_report(Fee(0, 2, 0, 0), 0, 0, MAX_UINT256, 0)
+
+    with pytest.raises(OverflowError):
+        simulate_report(Fee(1, 0, 0, 0), MAX_UINT256 // 2, 3, 0, 0)
+
+    # No overflow when the management fee is skipped.
+    assert simulate_report(Fee(1, 0, 0, 1), MAX_UINT256, 3, 0, 0) == (0, 0)
+
+
+@pytest.mark.usefixtures("session_setup")
+def test_simulate_report__matches_contract(
+    accountant,
+    daddy,
+    vault,
+    strategy,
+    asset,
+    amount,
+    deposit_into_vault,
+    provide_strategy_with_debt,
+    fund_refunds,
+):
+    rng = random.Random(69)
+
+    accountant.add_vault(vault, sender=daddy)
+
+    vault.add_strategy(strategy, sender=daddy)
+    vault.update_max_debt_for_strategy(strategy, MAX_INT, sender=daddy)
+
+    deposit_into_vault(vault, amount)
+    provide_strategy_with_debt(daddy, strategy, vault, amount)
+
+    params = vault.strategies(strategy)
+
+    for _ in range(25):
+        fee = Fee(
+            rng.randint(0, accountant.management_fee_threshold()),
+            rng.randint(0, accountant.performance_fee_threshold()),
+            rng.choice([0, rng.randint(0, 2**16 - 1)]),
+            rng.choice([0, rng.randint(0, 2**16 - 1)]),
+        )
+        accountant.set_custom_config(vault, strategy, *fee[:4], sender=daddy)
+
+        if rng.random() < 0.5:
+            gain, loss = rng.randint(0, amount), 0
+        else:
+            gain, loss = 0, rng.randint(0, amount)
+
+        fund_refunds(accountant, rng.randint(0, amount // 10))
+        refund_budget = accountant.refund_budget(asset)
+
+        chain.pending_timestamp += rng.randint(1, YEAR)
+
+        tx = accountant.report(strategy, gain, loss, sender=vault.address)
+
+        assert tuple(tx.return_value) == simulate_report(
+            fee,
+            params.current_debt,
+            tx.timestamp - params.last_report,
+            gain,
+            loss,
+            refund_budget,
+        )
+
+    # Both revert on overflow.
+    accountant.set_custom_config(vault, strategy, 0, 5_000, 0, 0, sender=daddy)
+
+    with ape.reverts():
+        accountant.report(strategy, MAX_UINT256 // 2, 0, sender=vault.address)
+
+    with pytest.raises(OverflowError):
+        simulate_report(
+            Fee(0, 5_000, 0, 0), params.current_debt, 0, MAX_UINT256 // 2, 0
+        )
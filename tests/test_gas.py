@@ -0,0 +1,257 @@
+from ape import project, chain
+from utils.constants import DAY, MAX_INT, WEEK
+import pytest
+
+pytestmark = pytest.mark.usefixtures("session_setup")
+
+
+def deploy_vault(vault_factory, asset, daddy, index=0):
+    tx = vault_factory.deploy_new_vault(
+        asset, f"Gas Vault {index}", f"yvGas{index}", daddy, WEEK, sender=daddy
+    )
+    return list(tx.decode_logs(vault_factory.NewVault))[0].vault_address
+
+
+def test_gas__release_registry(release_registry, vault_factory, daddy, gas_tracker):
+    tx = release_registry.newRelease(vault_factory, sender=daddy)
+    gas_tracker.record("ReleaseRegistry.newRelease", "first", tx.gas_used)
+
+    mock_factory = daddy.deploy(project.MockFactory, "6.9")
+    tx = release_registry.newRelease(mock_factory, sender=daddy)
+    gas_tracker.record("ReleaseRegistry.newRelease", "second", tx.gas_used)
+
+
+def test_gas__registry_factory(registry_factory, daddy, gas_tracker):
+    tx = registry_factory.createNewRegistry(daddy, "Gas Registry", sender=daddy)
+    gas_tracker.record("RegistryFactory.createNewRegistry", "full", tx.gas_used)
+
+    tx = registry_factory.cloneNewRegistry(daddy, "Gas Registry", sender=daddy)
+    gas_tracker.record("RegistryFactory.cloneNewRegistry", "clone", tx.gas_used)
+
+    tx = registry_factory.cloneNewRegistry(
+        daddy, "Gas Registry", b"\x01" * 32, sender=daddy
+    )
+    gas_tracker.record("RegistryFactory.cloneNewRegistry", "deterministic", tx.gas_used)
+
+
+def test_gas__endorse_vault(
+    registry, release_registry, vault_factory, asset, create_token, daddy, gas_tracker
+):
+    release_registry.newRelease(vault_factory, sender=daddy)
+
+    vaults = [deploy_vault(vault_factory, asset, daddy, i) for i in range(2)]
+
+    tx = registry.endorseVault(vaults[0], sender=daddy)
+    gas_tracker.record("Registry.endorseVault", "first_asset", tx.gas_used)
+
+    tx = registry.endorseVault(vaults[1], sender=daddy)
+    gas_tracker.record("Registry.endorseVault", "existing_asset", tx.gas_used)
+
+    other_asset = create_token("Other Token", "yOther")
+    vaults = [deploy_vault(vault_factory, other_asset, daddy, i) for i in range(10)]
+
+    tx = registry.endorseVaults(vaults, 0, [0] * 10, sender=daddy)
+    gas_tracker.record("Registry.endorseVaults", "10_first_asset", tx.gas_used)
+
+    tx = registry.newEndorsedVault(
+        asset, "Gas Vault", "yvGas", daddy, WEEK, 0, sender=daddy
+    )
+    gas_tracker.record("Registry.newEndorsedVault", "existing_asset", tx.gas_used)
+
+    tx = registry.tagVault(vaults[0], "Gas Tag", sender=daddy)
+    gas_tracker.record("Registry.tagVault", "new_tag", tx.gas_used)
+
+    tx = registry.tagVaults(vaults, ["Gas Tag"] * 10, sender=daddy)
+    gas_tracker.record("Registry.tagVaults", "10_tags", tx.gas_used)
+
+    tx = registry.removeVault(vaults[0], sender=daddy)
+    gas_tracker.record("Registry.removeVault", "swap", tx.gas_used)
+
+    tx = registry.removeVault(vaults[-1], sender=daddy)
+    gas_tracker.record("Registry.removeVault", "last", tx.gas_used)
+
+
+def test_gas__endorse_strategy(
+    registry,
+    release_registry,
+    vault_factory,
+    create_token,
+    create_strategy,
+    daddy,
+    gas_tracker,
+):
+    release_registry.newRelease(vault_factory, sender=daddy)
+
+    tx = registry.endorseStrategy(create_strategy(), sender=daddy)
+    gas_tracker.record("Registry.endorseStrategy", "first_asset", tx.gas_used)
+
+    tx = registry.endorseStrategy(create_strategy(), sender=daddy)
+    gas_tracker.record("Registry.endorseStrategy", "existing_asset", tx.gas_used)
+
+    strategies = [create_strategy() for _ in range(10)]
+    tx = registry.endorseStrategies(strategies, 0, [0] * 10, sender=daddy)
+    gas_tracker.record("Registry.endorseStrategies", "10_existing_asset", tx.gas_used)
+
+    tx = registry.endorseStrategyByApiVersion(create_strategy(), 0, sender=daddy)
+    gas_tracker.record(
+        "Registry.endorseStrategyByApiVersion", "existing_asset", tx.gas_used
+    )
+
+    strategies = [create_strategy() for _ in range(10)]
+    tx = registry.endorseStrategiesByApiVersion(strategies, [0] * 10, sender=daddy)
+    gas_tracker.record(
+        "Registry.endorseStrategiesByApiVersion", "10_existing_asset", tx.gas_used
+    )
+
+    tx = registry.removeStrategy(strategies[0], sender=daddy)
+    gas_tracker.record("Registry.removeStrategy", "swap", tx.gas_used)
+
+
+@pytest.mark.parametrize("config", ["default", "vault", "custom"])
+@pytest.mark.parametrize("outcome", ["gain", "loss", "loss_refund"])
+def test_gas__report(
+    accountant,
+    daddy,
+    vault,
+    strategy,
+    asset,
+    amount,
+    deposit_into_vault,
+    provide_strategy_with_debt,
+    fund_refunds,
+    gas_tracker,
+    config,
+    outcome,
+):
+    refund_ratio = 10_000 if outcome == "loss_refund" else 0
+
+    accountant.add_vault(vault, sender=daddy)
+    if config == "custom":
+        accountant.set_custom_config(
+            vault, strategy, 200, 2_000, refund_ratio, 0, sender=daddy
+        )
+    elif config == "vault":
+        accountant.set_vault_default_config(
+            vault, 200, 2_000, refund_ratio, 0, sender=daddy
+        )
+    else:
+        accountant.update_default_config(100, 1_000, refund_ratio, 0, sender=daddy)
+
+    vault.add_strategy(strategy, sender=daddy)
+    vault.update_max_debt_for_strategy(strategy, MAX_INT, sender=daddy)
+    deposit_into_vault(vault, amount)
+    provide_strategy_with_debt(daddy, strategy, vault, amount)
+
+    gain = amount // 10 if outcome == "gain" else 0
+    loss = 0 if outcome == "gain" else amount // 10
+
+    if refund_ratio > 0:
+        fund_refunds(accountant, loss)
+
+    chain.pending_timestamp = chain.pending_timestamp + DAY
+    chain.mine(timestamp=chain.pending_timestamp)
+
+    tx = accountant.report(strategy, gain, loss, sender=vault.address)
+
+    gas_tracker.record("GenericAccountant.report", f"{config}_{outcome}", tx.gas_used)
+
+
+def test_gas__accountant_config(
+    accountant, daddy, vault, create_vault, asset, strategy, gas_tracker
+):
+    tx = accountant.add_vault(vault, sender=daddy)
+    gas_tracker.record("GenericAccountant.add_vault", "new_vault", tx.gas_used)
+
+    vaults = [create_vault(asset) for _ in range(10)]
+    tx = accountant.add_vaults(vaults, sender=daddy)
+    gas_tracker.record("GenericAccountant.add_vaults", "10_new_vaults", tx.gas_used)
+
+    tx = accountant.update_default_config(100, 1_000, 0, 0, sender=daddy)
+    gas_tracker.record("GenericAccountant.update_default_config", "update", tx.gas_used)
+
+    tx = accountant.set_custom_config(vault, strategy, 200, 2_000, 0, 0, sender=daddy)
+    gas_tracker.record("GenericAccountant.set_custom_config", "new", tx.gas_used)
+
+    tx = accountant.set_vault_default_config(vault, 200, 2_000, 0, 0, sender=daddy)
+    gas_tracker.record("GenericAccountant.set_vault_default_config", "new", tx.gas_used)
+
+    tx = accountant.remove_custom_config(vault, strategy, sender=daddy)
+    gas_tracker.record(
+        "GenericAccountant.remove_custom_config", "existing", tx.gas_used
+    )
+
+    strategies = [v.address for v in vaults]
+    configs = [(200, 2_000, 0, 0, True)] * 10
+    tx = accountant.set_custom_configs(vault, strategies, configs, sender=daddy)
+    gas_tracker.record("GenericAccountant.set_custom_configs", "10_new", tx.gas_used)
+
+
+def test_gas__accountant_funds(
+    accountant,
+    daddy,
+    user,
+    vault,
+    asset,
+    create_token,
+    deposit_into_vault,
+    amount,
+    gas_tracker,
+):
+    deposit_into_vault(vault, amount // 2)
+    vault.transfer(accountant, amount // 2, sender=user)
+
+    tx = accountant.withdraw_underlying(vault, amount // 4, sender=daddy)
+    gas_tracker.record("GenericAccountant.withdraw_underlying", "partial", tx.gas_used)
+
+    tx = accountant.distribute(vault, sender=daddy)
+    gas_tracker.record("GenericAccountant.distribute", "vault_token", tx.gas_used)
+
+    asset.approve(accountant, amount // 4, sender=user)
+    tx = accountant.fund_refunds(asset, amount // 4, sender=user)
+    gas_tracker.record("GenericAccountant.fund_refunds", "existing", tx.gas_used)
+
+    tx = accountant.release_refund_budget(asset, amount // 4, sender=daddy)
+    gas_tracker.record(
+        "GenericAccountant.release_refund_budget", "partial", tx.gas_used
+    )
+
+    tokens = [
+        create_token(f"Gas Token {i}", f"yGas{i}", accountant, amount)
+        for i in range(10)
+    ]
+    tx = accountant.distribute_many(tokens, sender=daddy)
+    gas_tracker.record("GenericAccountant.distribute_many", "10_tokens", tx.gas_used)
+
+
+def test_gas__accountant_withdraw_underlying_many(
+    accountant,
+    daddy,
+    user,
+    asset,
+    create_vault,
+    deposit_into_vault,
+    amount,
+    gas_tracker,
+):
+    vaults = [create_vault(asset, vault_symbol=f"yvGas{i}") for i in range(10)]
+    for vault in vaults:
+        deposit_into_vault(vault, amount // 10)
+        vault.transfer(accountant, amount // 10, sender=user)
+
+    # Half from each vault one call at a time, the other half in one batch.
+    single_gas = sum(
+        accountant.withdraw_underlying(vault, amount // 20, sender=daddy).gas_used
+        for vault in vaults
+    )
+    gas_tracker.record(
+        "GenericAccountant.withdraw_underlying", "10_single_calls", single_gas
+    )
+
+    tx = accountant.withdraw_underlying_many(vaults, [amount // 20] * 10, sender=daddy)
+    gas_tracker.record(
+        "GenericAccountant.withdraw_underlying_many", "10_vaults", tx.gas_used
+    )
+
+    assert tx.return_value == [amount // 20] * 10
+    assert accountant.refund_budget(asset) == amount // 10 * 10
+    assert tx.gas_used < single_gas
@@ -1,6 +1,9 @@
 import ape
-from ape import chain
+from ape import chain, project
 from utils.constants import ChangeType, ZERO_ADDRESS, MAX_BPS, MAX_INT
+import pytest
+
+pytestmark = pytest.mark.usefixtures("session_setup")
 
 
 def test_setup(daddy, vault, strategy, accountant, fee_recipient):
@@ -78,6 +81,31 @@ def test_remove_vault(daddy, vault, strategy, accountant):
         accountant.report(strategy, 0, 0, sender=vault)
 
 
+def test_add_vaults(daddy, asset, vault, create_vault, accountant, user):
+    other_vault = create_vault(asset, vault_symbol="VV3B")
+
+    assert accountant.vaults(vault.address) == False
+    assert accountant.vaults(other_vault.address) == False
+
+    with ape.reverts("not fee manager"):
+        accountant.add_vaults([vault.address, other_vault.address], sender=user)
+
+    tx = accountant.add_vaults([vault.address, other_vault.address], sender=daddy)
+
+    event = list(tx.decode_logs(accountant.VaultChanged))
+
+    assert len(event) == 2
+    assert event[0].vault == vault.address
+    assert event[0].change == ChangeType.ADDED
+    assert event[1].vault == other_vault.address
+    assert event[1].change == ChangeType.ADDED
+    assert accountant.vaults(vault.address) == True
+    assert accountant.vaults(other_vault.address) == True
+
+    with ape.reverts("already added"):
+        accountant.add_vaults([vault.address], sender=daddy)
+
+
 def test_set_default_config(daddy, vault, strategy, accountant):
     assert accountant.default_config().management_fee == 100
     assert accountant.default_config().performance_fee == 1_000
@@ -153,6 +181,125 @@ def test_set_custom_config(daddy, vault, strategy, accountant):
     )
 
 
+def test_set_vault_default_config(
+    daddy, vault, strategy, create_strategy, accountant, user
+):
+    other_strategy = create_strategy()
+
+    vault.add_strategy(strategy.address, sender=daddy)
+    vault.add_strategy(other_strategy.address, sender=daddy)
+
+    assert accountant.vault_default_config(vault) == (0, 0, 0, 0, False)
+    assert accountant.has_vault_default(vault) == False
+
+    with ape.reverts("vault not added"):
+        accountant.set_vault_default_config(vault, 20, 2_000, 0, 0, sender=daddy)
+
+    accountant.add_vault(vault.address, sender=daddy)
+
+    with ape.reverts("not fee manager"):
+        accountant.set_vault_default_config(vault, 20, 2_000, 0, 0, sender=user)
+
+    with ape.reverts("exceeds management fee threshold"):
+        accountant.set_vault_default_config(vault, 201, 2_000, 0, 0, sender=daddy)
+
+    with ape.reverts("exceeds performance fee threshold"):
+        accountant.set_vault_default_config(vault, 20, 5_001, 0, 0, sender=daddy)
+
+    tx = accountant.set_vault_default_config(
+        vault, 20, 2_000, 13, 2**16 - 1, sender=daddy
+    )
+
+    event = list(tx.decode_logs(accountant.UpdateVaultDefaultConfig))
+
+    assert len(event) == 1
+    assert event[0].vault == vault.address
+    assert tuple(event[0].default_config) == (20, 2_000, 13, 2**16 - 1, False)
+
+    # Only per strategy configs are marked as custom.
+    assert accountant.vault_default_config(vault) == (20, 2_000, 13, 2**16 - 1, False)
+    assert accountant.has_vault_default(vault) == True
+    # Setting a config leaves the vault added.
+    assert accountant.vaults(vault) == True
+
+    # Strategies without a custom config use the vault default.
+    accountant.set_custom_config(vault, strategy, 0, 1_500, 0, 0, sender=daddy)
+
+    tx = accountant.report(other_strategy, 1_000, 0, sender=vault)
+    assert tuple(tx.return_value) == (200, 0)
+
+    tx = accountant.report(strategy, 1_000, 0, sender=vault)
+    assert tuple(tx.return_value) == (150, 0)
+
+    # Removing the vault keeps its default for when it is added back.
+    accountant.remove_vault(vault, sender=daddy)
+
+    assert accountant.vaults(vault) == False
+    assert accountant.vault_default_config(vault) == (20, 2_000, 13, 2**16 - 1, False)
+    assert accountant.has_vault_default(vault) == True
+
+    with ape.reverts("!authorized"):
+        accountant.report(other_strategy, 1_000, 0, sender=vault)
+
+    accountant.add_vault(vault, sender=daddy)
+
+    tx = accountant.report(other_strategy, 1_000, 0, sender=vault)
+    assert tuple(tx.return_value) == (200, 0)
+
+    with ape.reverts("not fee manager"):
+        accountant.remove_vault_default_config(vault, sender=user)
+
+    tx = accountant.remove_vault_default_config(vault, sender=daddy)
+
+    event = list(tx.decode_logs(accountant.UpdateVaultDefaultConfig))
+
+    assert len(event) == 1
+    assert event[0].vault == vault.address
+    assert tuple(event[0].default_config) == (0, 0, 0, 0, False)
+
+    assert accountant.vault_default_config(vault) == (0, 0, 0, 0, False)
+    assert accountant.has_vault_default(vault) == False
+    assert accountant.vaults(vault) == True
+
+    # Back to the global default.
+    tx = accountant.report(other_strategy, 1_000, 0, sender=vault)
+    assert tuple(tx.return_value) == (100, 0)
+
+    with ape.reverts("No vault default set"):
+        accountant.remove_vault_default_config(vault, sender=daddy)
+
+
+def test_set_custom_config__max_values(daddy, vault, strategy, accountant):
+    accountant.add_vault(vault.address, sender=daddy)
+
+    max_uint16 = 2**16 - 1
+    management = accountant.management_fee_threshold()
+    performance = accountant.performance_fee_threshold()
+
+    accountant.set_custom_config(
+        vault.address,
+        strategy.address,
+        management,
+        performance,
+        max_uint16,
+        max_uint16,
+        sender=daddy,
+    )
+
+    # Make sure no value bleeds into another once packed.
+    assert accountant.fees(vault.address, strategy.address) == (
+        management,
+        performance,
+        max_uint16,
+        max_uint16,
+        True,
+    )
+
+    accountant.update_default_config(0, 0, max_uint16, 0, sender=daddy)
+
+    assert accountant.default_config() == (0, 0, max_uint16, 0, False)
+
+
 def test_remove_custom_config(daddy, vault, strategy, accountant):
     accountant.add_vault(vault.address, sender=daddy)
 
@@ -206,6 +353,99 @@ def test_remove_custom_config(daddy, vault, strategy, accountant):
     assert accountant.fees(vault.address, strategy.address) == (0, 0, 0, 0, False)
 
 
+def test_set_custom_configs(daddy, vault, create_strategy, accountant, user):
+    strategies = [create_strategy() for _ in range(3)]
+    configs = [(20, 2_000, 13, 18, False), (0, 0, 0, 0, True), (200, 5_000, 0, 0, True)]
+
+    with ape.reverts("vault not added"):
+        accountant.set_custom_configs(vault, strategies, configs, sender=daddy)
+
+    accountant.add_vault(vault.address, sender=daddy)
+
+    with ape.reverts("not fee manager"):
+        accountant.set_custom_configs(vault, strategies, configs, sender=user)
+
+    with ape.reverts("length mismatch"):
+        accountant.set_custom_configs(vault, strategies, configs[:2], sender=daddy)
+
+    with ape.reverts("exceeds performance fee threshold"):
+        accountant.set_custom_configs(
+            vault, strategies[:1], [(0, 5_001, 0, 0, True)], sender=daddy
+        )
+
+    tx = accountant.set_custom_configs(vault, strategies, configs, sender=daddy)
+
+    event = list(tx.decode_logs(accountant.UpdateCustomFeeConfig))
+
+    assert len(event) == 3
+    for i in range(3):
+        # Should always be set to custom.
+        expected = configs[i][:4] + (True,)
+        assert event[i].vault == vault.address
+        assert event[i].strategy == strategies[i].address
+        assert tuple(event[i].custom_config) == expected
+        assert accountant.fees(vault.address, strategies[i].address) == expected
+
+    with ape.reverts("not fee manager"):
+        accountant.remove_custom_configs(vault, strategies, sender=user)
+
+    tx = accountant.remove_custom_configs(vault, strategies[:2], sender=daddy)
+
+    event = list(tx.decode_logs(accountant.UpdateCustomFeeConfig))
+
+    assert len(event) == 2
+    for i in range(2):
+        assert event[i].strategy == strategies[i].address
+        assert tuple(event[i].custom_config) == (0, 0, 0, 0, False)
+        assert accountant.fees(vault.address, strategies[i].address) == (
+            0,
+            0,
+            0,
+            0,
+            False,
+        )
+
+    assert accountant.fees(vault.address, strategies[2].address).custom == True
+
+    with ape.reverts("No custom fees set"):
+        accountant.remove_custom_configs(vault, strategies, sender=daddy)
+
+
+def test_get_effective_configs(daddy, vault, create_vault, asset, strategy, accountant):
+    other_vault = create_vault(asset)
+
+    default = tuple(accountant.default_config())
+    custom = (20, 2_000, 13, 18, True)
+
+    assert accountant.get_effective_configs([], []) == []
+
+    accountant.add_vault(vault.address, sender=daddy)
+    accountant.set_custom_config(vault, strategy, *custom[:4], sender=daddy)
+
+    configs = accountant.get_effective_configs(
+        [vault, other_vault, vault], [strategy, strategy, daddy]
+    )
+
+    # Falls back to the default without a custom config.
+    assert [tuple(config) for config in configs] == [custom, default, default]
+
+    # Then to the vault default if one is set.
+    accountant.set_vault_default_config(vault, 0, 500, 0, 0, sender=daddy)
+
+    configs = accountant.get_effective_configs(
+        [vault, other_vault, vault], [strategy, strategy, daddy]
+    )
+
+    assert [tuple(config) for config in configs] == [
+        custom,
+        default,
+        (0, 500, 0, 0, False),
+    ]
+
+    with ape.reverts("length mismatch"):
+        accountant.get_effective_configs([vault], [strategy, strategy])
+
+
 def test_set_fee_manager(accountant, daddy, user):
     assert accountant.fee_manager() == daddy
     assert accountant.future_fee_manager() == ZERO_ADDRESS
@@ -297,6 +537,7 @@ def test_distribute(
     assert len(event) == 1
     assert event[0].token == vault.address
     assert event[0].rewards == amount
+    assert accountant.total_distributed(vault) == amount
 
     assert vault.balanceOf(user) == 0
     assert vault.balanceOf(accountant.address) == 0
@@ -324,9 +565,147 @@ def test_withdraw_underlying(
 
     tx = accountant.withdraw_underlying(vault.address, amount, sender=daddy)
 
+    event = list(tx.decode_logs(accountant.UpdateRefundBudget))
+
+    assert len(event) == 1
+    assert event[0].asset == asset.address
+    assert event[0].refund_budget == amount
+
     assert vault.balanceOf(user) == 0
     assert vault.balanceOf(accountant.address) == 0
     assert asset.balanceOf(accountant.address) == amount
+    assert accountant.refund_budget(asset) == amount
+
+
+def test_distribute_many(
+    accountant, daddy, user, vault, asset, fee_recipient, deposit_into_vault, amount
+):
+    deposit_into_vault(vault, amount // 2)
+    vault.transfer(accountant.address, amount // 2, sender=user)
+    asset.transfer(accountant.address, amount // 4, sender=user)
+
+    tokens = [vault.address, asset.address]
+
+    with ape.reverts("not fee manager"):
+        accountant.distribute_many(tokens, sender=user)
+
+    tx = accountant.distribute_many(tokens, sender=daddy)
+
+    assert tx.return_value == [amount // 2, amount // 4]
+
+    event = list(tx.decode_logs(accountant.DistributeRewards))
+
+    assert len(event) == 2
+    assert event[0].token == vault.address
+    assert event[0].rewards == amount // 2
+    assert event[1].token == asset.address
+    assert event[1].rewards == amount // 4
+
+    assert vault.balanceOf(accountant.address) == 0
+    assert asset.balanceOf(accountant.address) == 0
+    assert vault.balanceOf(fee_recipient.address) == amount // 2
+    assert asset.balanceOf(fee_recipient.address) == amount // 4
+
+    # The totals keep counting up.
+    asset.transfer(accountant.address, amount // 8, sender=user)
+
+    tx = accountant.distribute_many(tokens, sender=daddy)
+
+    event = list(tx.decode_logs(accountant.DistributeRewards))
+
+    assert event[0].rewards == 0
+    assert event[1].rewards == amount // 8
+    assert accountant.total_distributed(vault) == amount // 2
+    assert accountant.total_distributed(asset) == amount // 4 + amount // 8
+
+
+def test_distribute_many__gas(accountant, daddy, create_token, amount, gas_tracker):
+    tokens = [
+        create_token(f"Test Token {i}", f"yTest{i}", accountant, amount)
+        for i in range(11)
+    ]
+
+    single_gas = accountant.distribute(tokens[0], sender=daddy).gas_used
+    gas_tracker.record("GenericAccountant.distribute", "single_token", single_gas)
+
+    tx = accountant.distribute_many(tokens[1:], sender=daddy)
+    batch_gas_per_token = tx.gas_used // 10
+    gas_tracker.record(
+        "GenericAccountant.distribute_many", "10_tokens_per_token", batch_gas_per_token
+    )
+
+    assert batch_gas_per_token < single_gas
+
+
+def test_withdraw_underlying_many(
+    accountant, daddy, user, asset, vault, create_vault, deposit_into_vault, amount
+):
+    other_vault = create_vault(asset, vault_symbol="VV3B")
+    vaults = [vault, other_vault]
+    amounts = [amount // 2, amount // 4]
+
+    for i in range(2):
+        deposit_into_vault(vaults[i], amounts[i])
+        vaults[i].transfer(accountant.address, amounts[i], sender=user)
+
+    with ape.reverts("not fee manager"):
+        accountant.withdraw_underlying_many(vaults, amounts, sender=user)
+
+    with ape.reverts("length mismatch"):
+        accountant.withdraw_underlying_many(vaults, amounts[:1], sender=daddy)
+
+    tx = accountant.withdraw_underlying_many(vaults, amounts, sender=daddy)
+
+    assert tx.return_value == amounts
+    assert vault.balanceOf(accountant.address) == 0
+    assert other_vault.balanceOf(accountant.address) == 0
+    assert asset.balanceOf(accountant.address) == amount // 2 + amount // 4
+    assert accountant.refund_budget(asset) == amount // 2 + amount // 4
+
+
+def test_fund_refunds(accountant, daddy, user, asset, fee_recipient, amount):
+    assert accountant.refund_budget(asset) == 0
+
+    asset.approve(accountant, amount // 2, sender=user)
+    tx = accountant.fund_refunds(asset, amount // 2, sender=user)
+
+    event = list(tx.decode_logs(accountant.UpdateRefundBudget))
+
+    assert len(event) == 1
+    assert event[0].asset == asset.address
+    assert event[0].refund_budget == amount // 2
+
+    assert accountant.refund_budget(asset) == amount // 2
+    assert asset.balanceOf(accountant) == amount // 2
+
+    # Only what is above the budget gets distributed.
+    asset.transfer(accountant, amount // 4, sender=user)
+
+    tx = accountant.distribute(asset, sender=daddy)
+
+    assert tx.return_value == amount // 4
+    assert asset.balanceOf(fee_recipient) == amount // 4
+    assert asset.balanceOf(accountant) == amount // 2
+
+    with ape.reverts("not fee manager"):
+        accountant.release_refund_budget(asset, amount // 2, sender=user)
+
+    with ape.reverts("exceeds refund budget"):
+        accountant.release_refund_budget(asset, amount // 2 + 1, sender=daddy)
+
+    tx = accountant.release_refund_budget(asset, amount // 8, sender=daddy)
+
+    event = list(tx.decode_logs(accountant.UpdateRefundBudget))
+
+    assert len(event) == 1
+    assert event[0].asset == asset.address
+    assert event[0].refund_budget == amount // 2 - amount // 8
+
+    tx = accountant.distribute(asset, sender=daddy)
+
+    assert tx.return_value == amount // 8
+    assert accountant.refund_budget(asset) == amount // 2 - amount // 8
+    assert asset.balanceOf(accountant) == amount // 2 - amount // 8
 
 
 def test_report_profit(
@@ -468,6 +847,63 @@ def test_report_max_fee(
     assert refunds == 0
 
 
+def test_report_loss_max_fee(
+    accountant,
+    daddy,
+    vault,
+    strategy,
+    amount,
+    user,
+    deposit_into_vault,
+    provide_strategy_with_debt,
+    asset,
+):
+    # Set max fee of 10% of gain
+    accountant.update_default_config(100, 1_000, 0, 1_000, sender=daddy)
+
+    accountant.add_vault(vault.address, sender=daddy)
+
+    vault.add_strategy(strategy.address, sender=daddy)
+    vault.update_max_debt_for_strategy(strategy.address, MAX_INT, sender=daddy)
+
+    deposit_into_vault(vault, amount)
+    provide_strategy_with_debt(daddy, strategy, vault, amount)
+
+    # Skip a year
+    chain.pending_timestamp = (
+        vault.strategies(strategy.address).last_report + 31_556_952 - 1
+    )
+    chain.mine(timestamp=chain.pending_timestamp)
+
+    # Management fees are clamped to 0 with no gain.
+    tx = accountant.report(strategy.address, 0, amount // 10, sender=vault.address)
+
+    fees, refunds = tx.return_value
+
+    assert fees == 0
+    assert refunds == 0
+
+    tx = accountant.report(strategy.address, 0, 0, sender=vault.address)
+
+    fees, refunds = tx.return_value
+
+    assert fees == 0
+    assert refunds == 0
+
+    # The vault is not asked for the strategy params when the fees clamp
+    # to 0, so a vault whose strategies() reverts can still report.
+    mock_vault = daddy.deploy(project.MockVault, asset)
+    accountant.add_vault(mock_vault, sender=daddy)
+
+    tx = accountant.report(strategy, 0, amount // 10, sender=mock_vault.address)
+
+    assert tuple(tx.return_value) == (0, 0)
+
+    # With a gain it is.
+    with ape.reverts("strategies called"):
+        accountant.report(strategy, amount // 10, 0, sender=mock_vault.address)
+
+
 def test_report_refund(
     accountant,
     daddy,
@@ -478,6 +914,7 @@ def test_report_refund(
     deposit_into_vault,
     provide_strategy_with_debt,
     asset,
+    fund_refunds,
 ):
     # SEt refund ratio to 100%
     accountant.update_default_config(100, 1_000, 10_000, 0, sender=daddy)
@@ -497,7 +934,7 @@ def test_report_refund(
     loss = amount // 10
 
     # make sure accountant has the funds
-    asset.mint(accountant.address, loss, sender=daddy)
+    fund_refunds(accountant, loss)
 
     # Skip a year
     chain.pending_timestamp = (
@@ -532,6 +969,7 @@ def test_report_refund_not_enough_asset(
     deposit_into_vault,
     provide_strategy_with_debt,
     asset,
+    fund_refunds,
 ):
     # SEt refund ratio to 100%
     accountant.update_default_config(100, 1_000, 10_000, 0, sender=daddy)
@@ -551,7 +989,7 @@ def test_report_refund_not_enough_asset(
     loss = amount // 10
 
     # make sure accountant has the funds
-    asset.mint(accountant.address, loss // 2, sender=daddy)
+    fund_refunds(accountant, loss // 2)
 
     # Skip a year
     chain.pending_timestamp = (
@@ -574,6 +1012,7 @@ def test_report_refund_not_enough_asset(
     assert expected_management_fees + expected_performance_fees == fees
     assert expected_refunds == refunds
     assert asset.allowance(accountant.address, vault.address) == expected_refunds
+    assert accountant.refund_budget(asset) == 0
 
 
 def test_report_profit__custom_config(
@@ -729,6 +1168,7 @@ def test_report_refund__custom_config(
     deposit_into_vault,
     provide_strategy_with_debt,
     asset,
+    fund_refunds,
 ):
     accountant.add_vault(vault.address, sender=daddy)
     # SEt refund ratio to 100%
@@ -749,7 +1189,7 @@ def test_report_refund__custom_config(
     loss = amount // 10
 
     # make sure accountant has the funds
-    asset.mint(accountant.address, loss, sender=daddy)
+    fund_refunds(accountant, loss)
 
     # Skip a year
     chain.pending_timestamp = (
@@ -784,6 +1224,7 @@ def test_report_refund_not_enough_asset__custom_config(
     deposit_into_vault,
     provide_strategy_with_debt,
     asset,
+    fund_refunds,
 ):
     accountant.add_vault(vault.address, sender=daddy)
     # SEt refund ratio to 100%
@@ -804,7 +1245,7 @@ def test_report_refund_not_enough_asset__custom_config(
     loss = amount // 10
 
     # make sure accountant has the funds
-    asset.mint(accountant.address, loss // 2, sender=daddy)
+    fund_refunds(accountant, loss // 2)
 
     # Skip a year
     chain.pending_timestamp = (
@@ -827,3 +1268,138 @@ def test_report_refund_not_enough_asset__custom_config(
     assert expected_management_fees + expected_performance_fees == fees
     assert expected_refunds == refunds
     assert asset.allowance(accountant.address, vault.address) == expected_refunds
+    assert accountant.refund_budget(asset) == 0
+
+
+def test_vault_totals(
+    accountant,
+    daddy,
+    vault,
+    strategy,
+    create_vault,
+    amount,
+    deposit_into_vault,
+    provide_strategy_with_debt,
+    asset,
+    fund_refunds,
+):
+    other_vault = create_vault(asset)
+
+    # No management fee so the fees don't depend on the block time.
+    accountant.update_default_config(0, 1_000, 10_000, 0, sender=daddy)
+    accountant.add_vaults([vault, other_vault], sender=daddy)
+
+    vault.add_strategy(strategy.address, sender=daddy)
+    vault.update_max_debt_for_strategy(strategy.address, MAX_INT, sender=daddy)
+
+    deposit_into_vault(vault, amount)
+    provide_strategy_with_debt(daddy, strategy, vault, amount)
+
+    assert accountant.vault_totals(vault) == (0, 0)
+
+    gain = amount // 10
+    loss = amount // 10
+
+    accountant.report(strategy, gain, 0, sender=vault.address)
+    accountant.report(strategy, gain, 0, sender=vault.address)
+
+    assert accountant.vault_totals(vault) == (2 * gain // 10, 0)
+
+    fund_refunds(accountant, loss)
+    accountant.report(strategy, 0, loss, sender=vault.address)
+
+    assert accountant.vault_totals(vault) == (2 * gain // 10, loss)
+    assert accountant.vault_totals(other_vault) == (0, 0)
+
+    # Totals are capped at max uint128.
+    accountant.set_custom_config(vault, strategy, 0, 5_000, 0, 0, sender=daddy)
+    accountant.report(strategy, 2**240, 0, sender=vault.address)
+
+    assert accountant.vault_totals(vault) == (2**128 - 1, loss)
+
+    accountant.report(strategy, gain, 0, sender=vault.address)
+
+    assert accountant.vault_totals(vault) == (2**128 - 1, loss)
+
+
+def test_preview_report(
+    accountant,
+    daddy,
+    vault,
+    strategy,
+    create_strategy,
+    amount,
+    deposit_into_vault,
+    provide_strategy_with_debt,
+    asset,
+    fund_refunds,
+):
+    # No management fee so the previews don't depend on the block time.
+    accountant.update_default_config(0, 1_000, 10_000, 0, sender=daddy)
+
+    vault.add_strategy(strategy.address, sender=daddy)
+    vault.update_max_debt_for_strategy(strategy.address, MAX_INT, sender=daddy)
+
+    deposit_into_vault(vault, amount)
+    provide_strategy_with_debt(daddy, strategy, vault, amount)
+
+    gain = amount // 10
+    loss = amount // 10
+
+    fund_refunds(accountant, loss // 4)
+
+    # Works before the vault is added with the default config.
+    assert accountant.preview_report(vault, strategy, gain, 0) == (
+        gain * 1_000 // MAX_BPS,
+        0,
+    )
+    assert accountant.preview_report(vault, strategy, 0, loss) == (0, loss // 4)
+
+    accountant.add_vault(vault.address, sender=daddy)
+    accountant.set_custom_config(vault, strategy, 0, 2_000, 5_000, 0, sender=daddy)
+
+    assert accountant.preview_report(vault, strategy, gain, 0) == (
+        gain * 2_000 // MAX_BPS,
+        0,
+    )
+    assert accountant.preview_report(vault, strategy, 0, loss) == (0, loss // 4)
+
+    other_strategy = create_strategy()
+    assert accountant.preview_report(vault, other_strategy, gain, 0) == (
+        gain * 1_000 // MAX_BPS,
+        0,
+    )
+
+    # Previews match what report returns.
+    for _gain, _loss in [(gain, 0), (0, loss), (0, 0)]:
+        preview = accountant.preview_report(vault, strategy, _gain, _loss)
+        tx = accountant.report(strategy, _gain, _loss, sender=vault.address)
+        assert tuple(tx.return_value) == tuple(preview)
+
+    # The refund was taken out of the budget.
+    assert accountant.refund_budget(asset) == 0
+    fund_refunds(accountant, loss // 4)
+
+    # Previews are views so nothing is approved.
+    allowance = asset.allowance(accountant, vault)
+    accountant.preview_report(vault, strategy, 0, loss)
+    assert asset.allowance(accountant, vault) == allowance
+
+    fees, refunds = accountant.preview_reports(
+        [vault, vault, vault],
+        [strategy, other_strategy, strategy],
+        [gain, gain, 0],
+        [0, 0, loss],
+    )
+
+    assert fees == [gain * 2_000 // MAX_BPS, gain * 1_000 // MAX_BPS, 0]
+    assert refunds == [0, 0, loss // 4]
+
+    with ape.reverts("length mismatch"):
+        accountant.preview_reports([vault], [strategy], [gain, 0], [0])
+
+    with ape.reverts("length mismatch"):
+        accountant.preview_reports([vault], [], [gain], [0])
+
+    with ape.reverts("length mismatch"):
+        accountant.preview_reports([vault], [strategy], [gain], [])
@@ -3,6 +3,8 @@ from ape import project, chain
 from utils.constants import WEEK, ZERO_ADDRESS
 import pytest
 
+pytestmark = pytest.mark.usefixtures("session_setup")
+
 
 def add_new_release(release_registry, factory, owner):
     txs = release_registry.newRelease(factory.address, sender=owner)
@@ -402,6 +404,453 @@ def test__endorse_strategy_wrong_api__reverts(
     registry.endorseStrategy(strategy, 0, 0, sender=daddy)
 
 
+def test__endorse_twice__reverts(
+    registry, asset, release_registry, vault_factory, daddy, create_vault, strategy
+):
+    add_new_release(
+        release_registry=release_registry, factory=vault_factory, owner=daddy
+    )
+
+    vaults = [create_vault(asset) for _ in range(2)]
+
+    assert registry.isEndorsed(vaults[0]) == False
+    assert registry.isEndorsed(strategy) == False
+
+    registry.endorseVault(vaults[0], sender=daddy)
+    registry.endorseVault(vaults[1], sender=daddy)
+    registry.endorseStrategy(strategy, sender=daddy)
+
+    assert registry.isEndorsed(vaults[0])
+    assert registry.isEndorsed(vaults[1])
+    assert registry.isEndorsed(strategy)
+
+    assert registry.positions(vaults[0]) == (0, 0)
+    assert registry.positions(vaults[1]) == (1, 1)
+    assert registry.positions(strategy) == (0, 0)
+
+    with ape.reverts("Already Endorsed"):
+        registry.endorseVault(vaults[0], sender=daddy)
+
+    with ape.reverts("Already Endorsed"):
+        registry.endorseStrategy(strategy, sender=daddy)
+
+    with ape.reverts("Already Endorsed"):
+        registry.endorseStrategies([strategy], 0, [0], sender=daddy)
+
+    new_vault = create_vault(asset)
+
+    # Duplicates in the same batch are caught as well.
+    with ape.reverts("Already Endorsed"):
+        registry.endorseVaults([new_vault, new_vault], 0, [0, 0], sender=daddy)
+
+    assert registry.getEndorsedVaults(asset) == vaults
+    assert registry.getEndorsedStrategies(asset) == [strategy.address]
+
+
+def test__endorse_by_api_version(
+    registry,
+    asset,
+    create_vault,
+    create_strategy,
+    release_registry,
+    vault_factory,
+    daddy,
+):
+    vault = create_vault(asset)
+    strategy = create_strategy()
+
+    # Nothing released yet.
+    with ape.reverts("ReleaseRegistry: unknown release"):
+        registry.endorseVaultByApiVersion(vault, 0, sender=daddy)
+
+    add_new_release(
+        release_registry=release_registry, factory=vault_factory, owner=daddy
+    )
+    # Add a mock factory for version release 1
+    mock_factory = daddy.deploy(project.MockFactory, "6.9")
+    add_new_release(
+        release_registry=release_registry, factory=mock_factory, owner=daddy
+    )
+
+    # The vault is endorsed under release 0 without giving a delta.
+    tx = registry.endorseVaultByApiVersion(vault, 69, sender=daddy)
+
+    event = list(tx.decode_logs(registry.NewEndorsedVault))
+
+    assert len(event) == 1
+    assert event[0].vault == vault.address
+    assert event[0].releaseVersion == 0
+    assert registry.info(vault).releaseVersion == 0
+    assert registry.info(vault).deploymentTimeStamp == 69
+    assert registry.getEndorsedVaultsByVersion(asset, 1) == [vault.address]
+
+    tx = registry.endorseStrategyByApiVersion(strategy, 0, sender=daddy)
+
+    event = list(tx.decode_logs(registry.NewEndorsedStrategy))
+
+    assert len(event) == 1
+    assert event[0].strategy == strategy.address
+    assert event[0].releaseVersion == 0
+
+    # Mixed versions can go in one batch.
+    strategies = [create_strategy(), create_strategy(apiVersion="6.9")]
+    unknown = create_strategy(apiVersion="1.0.0")
+
+    with ape.reverts("Registry: length mismatch"):
+        registry.endorseStrategiesByApiVersion(strategies, [0], sender=daddy)
+
+    with ape.reverts("ReleaseRegistry: unknown release"):
+        registry.endorseStrategiesByApiVersion(
+            strategies + [unknown], [0, 0, 0], sender=daddy
+        )
+
+    tx = registry.endorseStrategiesByApiVersion(strategies, [1, 2], sender=daddy)
+
+    event = list(tx.decode_logs(registry.NewEndorsedStrategy))
+
+    assert len(event) == 2
+    assert event[0].releaseVersion == 0
+    assert event[1].releaseVersion == 1
+    assert registry.info(strategies[1]).releaseVersion == 1
+    assert registry.getEndorsedStrategiesByVersion(asset, 0) == [strategies[1].address]
+
+    vaults = [create_vault(asset) for _ in range(2)]
+
+    with ape.reverts("Registry: length mismatch"):
+        registry.endorseVaultsByApiVersion(vaults, [], sender=daddy)
+
+    registry.endorseVaultsByApiVersion(vaults, [0, 0], sender=daddy)
+
+    assert registry.getEndorsedVaultsByVersion(asset, 1) == [vault.address] + [
+        v.address for v in vaults
+    ]
+
+    with ape.reverts("Already Endorsed"):
+        registry.endorseVaultByApiVersion(vault, 0, sender=daddy)
+
+
+def test__remove_vault(
+    registry, asset, create_token, release_registry, vault_factory, daddy, create_vault
+):
+    add_new_release(
+        release_registry=release_registry, factory=vault_factory, owner=daddy
+    )
+
+    other_asset = create_token("Other Token", "yOther")
+
+    vaults = [create_vault(asset) for _ in range(3)]
+    other_vault = create_vault(other_asset)
+
+    registry.endorseVaults(vaults, 0, [0] * 3, sender=daddy)
+    registry.endorseVault(other_vault, sender=daddy)
+
+    assert registry.getAssets() == [asset.address, other_asset.address]
+
+    with ape.reverts("!Endorsed"):
+        registry.removeVault(daddy, sender=daddy)
+
+    # Remove from the middle and the last vault moves into its place.
+    tx = registry.removeVault(vaults[0], sender=daddy)
+
+    event = list(tx.decode_logs(registry.RemovedVault))
+
+    assert len(event) == 1
+    assert event[0].vault == vaults[0].address
+    assert event[0].asset == asset.address
+    assert event[0].releaseVersion == 0
+
+    remaining = [vaults[2].address, vaults[1].address]
+    assert registry.getEndorsedVaults(asset) == remaining
+    assert registry.getEndorsedVaultsByVersion(asset, 0) == remaining
+    assert registry.positions(vaults[2]) == (0, 0)
+    assert registry.positions(vaults[1]) == (1, 1)
+    assert registry.positions(vaults[0]) == (0, 0)
+    assert registry.isEndorsed(vaults[0]) == False
+    assert registry.info(vaults[0]).asset == ZERO_ADDRESS
+
+    with ape.reverts("!Endorsed"):
+        registry.removeVault(vaults[0], sender=daddy)
+
+    # Removing the only vault of an asset prunes the asset.
+    registry.removeVault(other_vault, sender=daddy)
+
+    assert registry.getEndorsedVaults(other_asset) == []
+    assert registry.getAssets() == [asset.address]
+    assert registry.assetIsUsed(other_asset) == False
+
+    # The first asset gets pruned by removing its last vault.
+    registry.removeVault(vaults[1], sender=daddy)
+    registry.removeVault(vaults[2], sender=daddy)
+
+    assert registry.getEndorsedVaults(asset) == []
+    assert registry.numAssets() == 0
+
+    # Removed vaults can be endorsed again.
+    registry.endorseVault(vaults[0], sender=daddy)
+
+    assert registry.getAssets() == [asset.address]
+    assert registry.getEndorsedVaults(asset) == [vaults[0].address]
+    assert registry.positions(vaults[0]) == (0, 0)
+
+
+def test__remove_strategy(
+    registry, asset, create_strategy, release_registry, vault_factory, daddy, vault
+):
+    add_new_release(
+        release_registry=release_registry, factory=vault_factory, owner=daddy
+    )
+
+    strategies = [create_strategy() for _ in range(2)]
+
+    registry.endorseStrategies(strategies, 0, [0, 0], sender=daddy)
+    registry.endorseVault(vault, sender=daddy)
+
+    # Can't remove a vault as a strategy or a strategy as a vault.
+    with ape.reverts("!Endorsed"):
+        registry.removeStrategy(vault, sender=daddy)
+
+    with ape.reverts("!Endorsed"):
+        registry.removeVault(strategies[1], sender=daddy)
+
+    tx = registry.removeStrategy(strategies[0], sender=daddy)
+
+    event = list(tx.decode_logs(registry.RemovedStrategy))
+
+    assert len(event) == 1
+    assert event[0].strategy == strategies[0].address
+    assert event[0].asset == asset.address
+    assert event[0].releaseVersion == 0
+
+    assert registry.getEndorsedStrategies(asset) == [strategies[1].address]
+    assert registry.getEndorsedStrategiesByVersion(asset, 0) == [strategies[1].address]
+    assert registry.positions(strategies[1]) == (0, 0)
+    assert registry.isEndorsed(strategies[0]) == False
+
+    # The asset is still used by the vault.
+    registry.removeStrategy(strategies[1], sender=daddy)
+
+    assert registry.getEndorsedStrategies(asset) == []
+    assert registry.getAssets() == [asset.address]
+
+    registry.removeVault(vault, sender=daddy)
+
+    assert registry.getAssets() == []
+
+
+def test__endorse_vaults(registry, asset, release_registry, vault_factory, daddy):
+    add_new_release(
+        release_registry=release_registry, factory=vault_factory, owner=daddy
+    )
+
+    vaults = []
+    timestamps = []
+    for i in range(3):
+        tx = vault_factory.deploy_new_vault(
+            asset, f"Test Vault {i}", f"yvTest{i}", daddy, WEEK, sender=daddy
+        )
+        vaults.append(list(tx.decode_logs(vault_factory.NewVault))[0].vault_address)
+        timestamps.append(tx.timestamp)
+
+    with ape.reverts("Registry: length mismatch"):
+        registry.endorseVaults(vaults, 0, timestamps[:2], sender=daddy)
+
+    tx = registry.endorseVaults(vaults, 0, timestamps, sender=daddy)
+
+    event = list(tx.decode_logs(registry.NewEndorsedVault))
+
+    assert len(event) == 3
+    for i in range(3):
+        assert event[i].vault == vaults[i]
+        assert event[i].asset == asset.address
+        assert event[i].releaseVersion == 0
+        assert registry.info(vaults[i]).asset == asset.address
+        assert registry.info(vaults[i]).releaseVersion == 0
+        assert registry.info(vaults[i]).deploymentTimeStamp == timestamps[i]
+
+    assert registry.numAssets() == 1
+    assert registry.getEndorsedVaults(asset) == vaults
+    assert registry.getEndorsedVaultsByVersion(asset, 0) == vaults
+
+
+def test__endorse_strategies(
+    registry, asset, create_strategy, release_registry, vault_factory, daddy
+):
+    # Add a mock factory for version release 1
+    mock_factory = daddy.deploy(project.MockFactory, "6.9")
+    add_new_release(
+        release_registry=release_registry, factory=mock_factory, owner=daddy
+    )
+    add_new_release(
+        release_registry=release_registry, factory=vault_factory, owner=daddy
+    )
+
+    strategies = [create_strategy() for _ in range(3)]
+
+    # Can't endorse with the wrong api version.
+    with ape.reverts("Wrong API Version"):
+        registry.endorseStrategies(strategies, 1, [0, 0, 0], sender=daddy)
+
+    tx = registry.endorseStrategies(strategies, 0, [0, 0, 0], sender=daddy)
+
+    event = list(tx.decode_logs(registry.NewEndorsedStrategy))
+
+    assert len(event) == 3
+    for i in range(3):
+        assert event[i].strategy == strategies[i].address
+        assert event[i].asset == asset.address
+        assert event[i].releaseVersion == 1
+        assert registry.info(strategies[i]).asset == asset.address
+        assert registry.info(strategies[i]).releaseVersion == 1
+
+    assert registry.numAssets() == 1
+    assert registry.getEndorsedStrategies(asset) == [s.address for s in strategies]
+    assert registry.numEndorsedStrategiesByVersion(asset, 0) == 3
+
+
+@pytest.mark.parametrize("batch_size", [1, 10, 100])
+def test__endorse_strategies__gas(
+    registry,
+    create_strategy,
+    release_registry,
+    vault_factory,
+    daddy,
+    batch_size,
+    gas_tracker,
+):
+    add_new_release(
+        release_registry=release_registry, factory=vault_factory, owner=daddy
+    )
+
+    # Endorse one first so all measurements are for an already used asset.
+    registry.endorseStrategy(create_strategy(), sender=daddy)
+
+    single_gas = registry.endorseStrategy(create_strategy(), sender=daddy).gas_used
+    gas_tracker.record(
+        "Registry.endorseStrategy", f"before_batch_of_{batch_size}", single_gas
+    )
+
+    strategies = [create_strategy() for _ in range(batch_size)]
+    tx = registry.endorseStrategies(strategies, 0, [0] * batch_size, sender=daddy)
+    batch_gas_per_item = tx.gas_used // batch_size
+    gas_tracker.record(
+        "Registry.endorseStrategies", f"{batch_size}_per_strategy", batch_gas_per_item
+    )
+
+    if batch_size > 1:
+        assert batch_gas_per_item < single_gas
+
+
+def test__paginated_views(
+    registry, asset, create_token, release_registry, vault_factory, daddy
+):
+    add_new_release(
+        release_registry=release_registry, factory=vault_factory, owner=daddy
+    )
+
+    other_asset = create_token("Other Token", "yOther")
+
+    vaults = []
+    for i, token in enumerate([asset, asset, asset, other_asset, other_asset]):
+        tx = registry.newEndorsedVault(
+            token, f"Test Vault {i}", f"yvTest{i}", daddy, WEEK, 0, sender=daddy
+        )
+        vaults.append(list(tx.decode_logs(registry.NewEndorsedVault))[0].vault)
+
+    assert registry.getAssetsPage(0, 10) == [asset.address, other_asset.address]
+    assert registry.getAssetsPage(1, 10) == [other_asset.address]
+    assert registry.getAssetsPage(2, 10) == []
+
+    assert registry.getEndorsedVaultsPage(asset, 0, 2) == vaults[:2]
+    assert registry.getEndorsedVaultsPage(asset, 2, 2) == vaults[2:3]
+    assert registry.getEndorsedVaultsPage(asset, 3, 2) == []
+    assert registry.getEndorsedVaultsPage(other_asset, 0, 10) == vaults[3:]
+    assert registry.getEndorsedStrategiesPage(asset, 0, 10) == []
+
+    # Walk all vaults in chunks that cross the asset boundaries.
+    for limit in [1, 2, 3, 5, 10]:
+        walked = []
+        cursor = 0
+        while True:
+            page, cursor = registry.getAllEndorsedVaultsPage(cursor, limit)
+            assert len(page) <= limit
+            walked += page
+            if cursor == 0:
+                break
+
+        assert walked == vaults
+
+    strategies, cursor = registry.getAllEndorsedStrategiesPage(0, 10)
+    assert strategies == []
+    assert cursor == 0
+
+    with ape.reverts("Registry: zero limit"):
+        registry.getAllEndorsedVaultsPage(0, 0)
+
+    with ape.reverts("Registry: zero limit"):
+        registry.getAllEndorsedStrategiesPage(0, 0)
+
+
+def test__registry_snapshot(
+    registry,
+    asset,
+    create_token,
+    create_vault,
+    create_strategy,
+    release_registry,
+    vault_factory,
+    daddy,
+):
+    add_new_release(
+        release_registry=release_registry, factory=vault_factory, owner=daddy
+    )
+
+    snapshot = registry.getRegistrySnapshot(0, 10)
+    assert snapshot.addresses == []
+    assert snapshot.tags == []
+
+    other_asset = create_token("Other Token", "yOther")
+
+    vaults = [create_vault(asset), create_vault(other_asset)]
+    strategies = [create_strategy(asset), create_strategy(other_asset)]
+
+    registry.endorseVault(vaults[0], 0, 1, sender=daddy)
+    registry.endorseStrategy(strategies[0], 0, 2, sender=daddy)
+    registry.endorseStrategy(strategies[1], 0, 3, sender=daddy)
+    registry.endorseVault(vaults[1], 0, 4, sender=daddy)
+    registry.tagVault(strategies[1], "Test Tag", sender=daddy)
+
+    # Each assets vaults come before its strategies.
+    expected = [
+        (vaults[0].address, asset.address, 1, "", False),
+        (strategies[0].address, asset.address, 2, "", True),
+        (vaults[1].address, other_asset.address, 4, "", False),
+        (strategies[1].address, other_asset.address, 3, "Test Tag", True),
+    ]
+
+    for limit in [1, 2, 3, 4, 10]:
+        walked = []
+        offset = 0
+        while True:
+            snapshot = registry.getRegistrySnapshot(offset, limit)
+            walked += list(
+                zip(
+                    snapshot.addresses,
+                    snapshot.assets,
+                    snapshot.deploymentTimeStamps,
+                    snapshot.tags,
+                    snapshot.isStrategy,
+                )
+            )
+            assert snapshot.releaseVersions == [0] * len(snapshot.addresses)
+            offset += limit
+            if len(snapshot.addresses) < limit:
+                break
+
+        assert walked == expected
+
+    assert registry.getRegistrySnapshot(4, 10).addresses == []
+
+
 def test__tag_vault(registry, asset, release_registry, vault_factory, daddy, strategy):
     add_new_release(
         release_registry=release_registry, factory=vault_factory, owner=daddy
@@ -424,7 +873,13 @@ def test__tag_vault(registry, asset, release_registry, vault_factory, daddy, str
 
     tag = "Test Tag"
 
-    registry.tagVault(vault.address, tag, sender=daddy)
+    tx = registry.tagVault(vault.address, tag, sender=daddy)
+
+    event = list(tx.decode_logs(registry.VaultTagged))
+
+    assert len(event) == 1
+    assert event[0].vault == vault.address
+    assert event[0].tag == tag
 
     assert registry.info(vault.address).asset == asset.address
     assert registry.info(vault.address).tag == tag
@@ -447,6 +902,41 @@ def test__tag_vault(registry, asset, release_registry, vault_factory, daddy, str
     assert registry.info(strategy.address).tag == tag
 
 
+def test__tag_vaults(
+    registry, asset, release_registry, vault_factory, daddy, strategy, create_vault
+):
+    add_new_release(
+        release_registry=release_registry, factory=vault_factory, owner=daddy
+    )
+
+    vault = create_vault(asset)
+    registry.endorseVault(vault, sender=daddy)
+
+    tags = ["Vault Tag", "Strategy Tag"]
+
+    with ape.reverts("Registry: length mismatch"):
+        registry.tagVaults([vault, strategy], tags[:1], sender=daddy)
+
+    # Can't tag if any of them is not endorsed.
+    with ape.reverts("!Endorsed"):
+        registry.tagVaults([vault, strategy], tags, sender=daddy)
+
+    registry.endorseStrategy(strategy, sender=daddy)
+
+    tx = registry.tagVaults([vault, strategy], tags, sender=daddy)
+
+    event = list(tx.decode_logs(registry.VaultTagged))
+
+    assert len(event) == 2
+    assert event[0].vault == vault.address
+    assert event[0].tag == tags[0]
+    assert event[1].vault == strategy.address
+    assert event[1].tag == tags[1]
+
+    assert registry.info(vault).tag == tags[0]
+    assert registry.info(strategy).tag == tags[1]
+
+
 def test__access(
     registry, asset, release_registry, vault_factory, daddy, strategy, user
 ):
@@ -485,9 +975,38 @@ def test__access(
     with ape.reverts("!governance"):
         registry.endorseStrategy(strategy, sender=user)
 
+    # cant endorse in batches
+    with ape.reverts("!governance"):
+        registry.endorseVaults([new_vault], 0, [0], sender=user)
+
+    with ape.reverts("!governance"):
+        registry.endorseStrategies([strategy], 0, [0], sender=user)
+
     with ape.reverts("!governance"):
         registry.tagVault(strategy, "tag", sender=user)
 
+    with ape.reverts("!governance"):
+        registry.tagVaults([strategy], ["tag"], sender=user)
+
+    with ape.reverts("!governance"):
+        registry.endorseVaultByApiVersion(new_vault, 0, sender=user)
+
+    with ape.reverts("!governance"):
+        registry.endorseVaultsByApiVersion([new_vault], [0], sender=user)
+
+    with ape.reverts("!governance"):
+        registry.endorseStrategyByApiVersion(strategy, 0, sender=user)
+
+    with ape.reverts("!governance"):
+        registry.endorseStrategiesByApiVersion([strategy], [0], sender=user)
+
+    # cant remove
+    with ape.reverts("!governance"):
+        registry.removeVault(new_vault, sender=user)
+
+    with ape.reverts("!governance"):
+        registry.removeStrategy(strategy, sender=user)
+
     # cant transfer governance
     with ape.reverts("!governance"):
         registry.transferGovernance(user, sender=user)
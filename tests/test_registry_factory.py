@@ -3,6 +3,8 @@ from ape import project
 from utils.constants import ZERO_ADDRESS
 import pytest
 
+pytestmark = pytest.mark.usefixtures("session_setup")
+
 
 def test__factory_set_up(registry_factory, release_registry, daddy):
     assert registry_factory.releaseRegistry() == release_registry
@@ -31,3 +33,97 @@ def test__new_registry(registry_factory, release_registry, management):
     assert new_registry.releaseRegistry() == release_registry
     assert new_registry.name() == new_name
     assert new_registry.numAssets() == 0
+
+
+def test__clone_new_registry(registry_factory, release_registry, management):
+    new_name = "new test registry"
+
+    # create a new registry clone
+    tx = registry_factory.cloneNewRegistry(new_name, sender=management)
+
+    event = list(tx.decode_logs(registry_factory.NewRegistry))
+    new_registry = project.Registry.at(event[0].newRegistry)
+
+    assert len(event) == 1
+    assert event[0].newRegistry == new_registry
+    assert event[0].governance == management
+    assert event[0].name == new_name
+
+    # make sure it is set up correctly
+    assert new_registry.governance() == management
+    assert new_registry.releaseRegistry() == release_registry
+    assert new_registry.name() == new_name
+    assert new_registry.numAssets() == 0
+
+    # Can't be initialized again.
+    with ape.reverts("initialized"):
+        new_registry.initialize(management, "hijack", sender=management)
+
+    # Neither can the implementation.
+    implementation = project.Registry.at(registry_factory.registryImplementation())
+    assert implementation.governance() == registry_factory
+    with ape.reverts("initialized"):
+        implementation.initialize(management, "hijack", sender=management)
+
+
+def test__clone_new_registry__deterministic(
+    registry_factory, release_registry, management, user
+):
+    new_name = "new test registry"
+    salt = b"\x01" * 32
+
+    expected = registry_factory.predictRegistryAddress(management, salt)
+
+    # The same salt with a different governance gives a different address.
+    assert registry_factory.predictRegistryAddress(user, salt) != expected
+
+    tx = registry_factory.cloneNewRegistry(management, new_name, salt, sender=user)
+
+    event = list(tx.decode_logs(registry_factory.NewRegistry))
+    new_registry = project.Registry.at(event[0].newRegistry)
+
+    assert new_registry.address == expected
+    assert new_registry.governance() == management
+    assert new_registry.releaseRegistry() == release_registry
+    assert new_registry.name() == new_name
+
+    # Can't deploy to the same address twice.
+    with ape.reverts():
+        registry_factory.cloneNewRegistry(management, new_name, salt, sender=user)
+
+
+def test__clone_vs_full_registry__gas(
+    registry_factory, release_registry, vault_factory, strategy, daddy, gas_tracker
+):
+    full_tx = registry_factory.createNewRegistry(daddy, "Full", sender=daddy)
+    full = project.Registry.at(
+        list(full_tx.decode_logs(registry_factory.NewRegistry))[0].newRegistry
+    )
+
+    clone_tx = registry_factory.cloneNewRegistry(daddy, "Clone", sender=daddy)
+    clone = project.Registry.at(
+        list(clone_tx.decode_logs(registry_factory.NewRegistry))[0].newRegistry
+    )
+
+    release_registry.newRelease(vault_factory.address, sender=daddy)
+
+    full_endorse = full.endorseStrategy(strategy, sender=daddy).gas_used
+    clone_endorse = clone.endorseStrategy(strategy, sender=daddy).gas_used
+
+    full_read = full.info.estimate_gas_cost(strategy)
+    clone_read = clone.info.estimate_gas_cost(strategy)
+
+    gas_tracker.record(
+        "RegistryFactory.createNewRegistry", "vs_clone", full_tx.gas_used
+    )
+    gas_tracker.record("RegistryFactory.cloneNewRegistry", "vs_full", clone_tx.gas_used)
+    gas_tracker.record("Registry.endorseStrategy", "full_registry", full_endorse)
+    gas_tracker.record("Registry.endorseStrategy", "cloned_registry", clone_endorse)
+    gas_tracker.record("Registry.info", "full_registry", full_read)
+    gas_tracker.record("Registry.info", "cloned_registry", clone_read)
+
+    assert clone_tx.gas_used < full_tx.gas_used
+    assert clone_endorse > full_endorse
+    assert clone_read > full_read
+    # The deploy savings should cover the proxy overhead for a long time.
+    assert full_tx.gas_used - clone_tx.gas_used > 100 * (clone_endorse - full_endorse)
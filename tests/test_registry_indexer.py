@@ -0,0 +1,133 @@
+from ape import chain
+from registry_indexer import RegistryIndexer
+from utils.constants import WEEK
+import pytest
+
+pytestmark = pytest.mark.usefixtures("session_setup")
+
+
+def test__index_registry(
+    w3,
+    registry,
+    release_registry,
+    vault_factory,
+    asset,
+    create_token,
+    create_vault,
+    create_strategy,
+    daddy,
+    tmp_path,
+):
+    start_block = chain.blocks.head.number + 1
+    db_path = str(tmp_path / "registry.db")
+
+    release_registry.newRelease(vault_factory, sender=daddy)
+
+    tx = registry.newEndorsedVault(
+        asset, "New vault", "yvTest", daddy, WEEK, 0, sender=daddy
+    )
+    vault = list(tx.decode_logs(registry.NewEndorsedVault))[0].vault
+
+    strategy = create_strategy(asset)
+    registry.endorseStrategy(strategy, sender=daddy)
+
+    other_asset = create_token("Other Token", "yOther")
+    other_vault = create_vault(other_asset)
+    registry.endorseVault(other_vault, 0, 69, sender=daddy)
+
+    # Use a small batch size to index over multiple ranges. The local
+    # chain only mines on demand so don't wait for confirmations.
+    indexer = RegistryIndexer(
+        w3,
+        registry.address,
+        db_path=db_path,
+        start_block=start_block,
+        batch_size=2,
+        confirmations=0,
+    )
+
+    assert indexer.sync() == chain.blocks.head.number
+
+    assert indexer.get_releases() == [
+        {
+            "release_id": 0,
+            "factory": vault_factory.address,
+            "api_version": vault_factory.api_version(),
+        }
+    ]
+    assert indexer.get_assets() == [asset.address, other_asset.address]
+
+    vaults = indexer.get_vaults()
+    assert [v["address"] for v in vaults] == [vault, other_vault.address]
+    assert vaults[0]["asset"] == asset.address
+    assert vaults[0]["release_version"] == 0
+    assert vaults[0]["api_version"] == vault_factory.api_version()
+    assert vaults[0]["deployment_timestamp"] == registry.info(vault).deploymentTimeStamp
+    assert vaults[1]["deployment_timestamp"] == 69
+
+    strategies = indexer.get_strategies(asset.address)
+    assert [s["address"] for s in strategies] == [strategy.address]
+    assert strategies[0]["is_strategy"] == 1
+
+    assert [v["address"] for v in indexer.get_vaults(other_asset.address)] == [
+        other_vault.address
+    ]
+    assert len(indexer.get_by_release(0)) == 3
+    assert len(indexer.get_by_api_version(vault_factory.api_version())) == 3
+    assert indexer.get_by_release(1) == []
+
+    # Tags are picked up from the events.
+    registry.tagVault(vault, "Test Tag", sender=daddy)
+    assert indexer.get_by_tag("Test Tag") == []
+
+    indexer.sync()
+    assert [v["address"] for v in indexer.get_by_tag("Test Tag")] == [vault]
+
+    registry.tagVaults([vault, strategy], ["New Tag", "New Tag"], sender=daddy)
+
+    indexer.sync()
+    assert indexer.get_by_tag("Test Tag") == []
+    assert [v["address"] for v in indexer.get_by_tag("New Tag")] == [
+        vault,
+        strategy.address,
+    ]
+
+    indexer.close()
+
+    # A new indexer on the same database resumes from the last block.
+    new_strategy = create_strategy(other_asset)
+    registry.endorseStrategy(new_strategy, sender=daddy)
+
+    indexer = RegistryIndexer(w3, registry.address, db_path=db_path, confirmations=0)
+    last_block = indexer.last_block
+
+    assert indexer.sync() == chain.blocks.head.number
+    assert indexer.last_block > last_block
+    assert [s["address"] for s in indexer.get_strategies(other_asset.address)] == [
+        new_strategy.address
+    ]
+    assert len(indexer.get_vaults()) == 2
+
+    # Removed vaults and strategies are dropped, along with unused assets.
+    registry.removeVault(other_vault, sender=daddy)
+    registry.removeStrategy(new_strategy, sender=daddy)
+
+    indexer.sync()
+    assert [v["address"] for v in indexer.get_vaults()] == [vault]
+    assert indexer.get_strategies(other_asset.address) == []
+    assert indexer.get_assets() == [asset.address]
+
+    indexer.close()
+
+    # Blocks without enough confirmations are left for a later sync.
+    indexer = RegistryIndexer(
+        w3,
+        registry.address,
+        db_path=str(tmp_path / "confirmed.db"),
+        start_block=start_block,
+        confirmations=2,
+    )
+
+    assert indexer.sync() == chain.blocks.head.number - 2
+
+    indexer.close()
@@ -1,14 +1,19 @@
 import ape
 from ape import project
 from utils.constants import ZERO_ADDRESS
+from web3 import Web3
 import pytest
 
+pytestmark = pytest.mark.usefixtures("session_setup")
+
 
 def test__deployment(release_registry, daddy):
     assert release_registry.governance() == daddy
     assert release_registry.numReleases() == 0
     assert release_registry.factories(0) == ZERO_ADDRESS
     assert release_registry.releaseTargets("3.1.0") == 0
+    assert release_registry.releaseApiHash(0) == b"\x00" * 32
+    assert release_registry.releaseApiVersion(0) == ""
 
 
 def test_new_release(release_registry, daddy, vault_factory):
@@ -29,6 +34,10 @@ def test_new_release(release_registry, daddy, vault_factory):
     assert release_registry.releaseTargets(vault_factory.api_version()) == 0
     assert release_registry.latestFactory() == vault_factory.address
     assert release_registry.latestRelease() == vault_factory.api_version()
+    assert release_registry.releaseApiVersion(0) == vault_factory.api_version()
+    assert release_registry.releaseApiHash(0) == Web3.keccak(
+        text=vault_factory.api_version()
+    )
 
     new_api = "4.3.2"
     # Deploy a new mock factory with a different api
@@ -48,10 +57,13 @@ def test_new_release(release_registry, daddy, vault_factory):
     assert release_registry.releaseTargets(new_factory.api_version()) == 1
     assert release_registry.latestFactory() == new_factory.address
     assert release_registry.latestRelease() == new_api
+    assert release_registry.releaseApiVersion(1) == new_api
+    assert release_registry.releaseApiHash(1) == Web3.keccak(text=new_api)
 
     # make sure the first factory is still returning
     assert release_registry.factories(0) == vault_factory.address
     assert release_registry.releaseTargets(vault_factory.api_version()) == 0
+    assert release_registry.releaseApiVersion(0) == vault_factory.api_version()
 
 
 def test_access(release_registry, daddy, user, vault_factory):
@@ -111,3 +123,34 @@ def test__transfer_governance(release_registry, daddy, user):
     assert event[0].previousGovernance == daddy
     assert event[0].newGovernance == user
     assert release_registry.governance() == user
+
+
+def test__release_lookup(release_registry, daddy, vault_factory):
+    api_version = vault_factory.api_version()
+
+    # Unknown and release 0 both give 0 from `releaseTargets`.
+    assert release_registry.releaseTargets(api_version) == 0
+    assert release_registry.isRelease(api_version) == False
+    assert release_registry.isRelease("") == False
+
+    with ape.reverts("ReleaseRegistry: unknown release"):
+        release_registry.releaseIdOf(api_version)
+
+    release_registry.newRelease(vault_factory.address, sender=daddy)
+
+    assert release_registry.isRelease(api_version)
+    assert release_registry.releaseIdOf(api_version) == 0
+
+    new_api = "4.3.2"
+    new_factory = daddy.deploy(project.MockFactory, new_api)
+
+    assert release_registry.isRelease(new_api) == False
+
+    release_registry.newRelease(new_factory.address, sender=daddy)
+
+    assert release_registry.isRelease(new_api)
+    assert release_registry.releaseIdOf(new_api) == 1
+    assert release_registry.releaseIdOf(api_version) == 0
+
+    with ape.reverts("ReleaseRegistry: unknown release"):
+        release_registry.releaseIdOf("1.0.0")
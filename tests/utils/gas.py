@@ -0,0 +1,83 @@
+from utils.gas_budgets import BUDGETS, DEFAULT_BUDGET
+import fcntl
+import json
+import os
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Kept out of the tests folder so black does not try to format it.
+BASELINE_PATH = os.getenv("GAS_BASELINE", os.path.join(ROOT_DIR, "gas_baseline.json"))
+MAX_BPS = 10_000
+
+
+def load_json(path):
+    if not os.path.exists(path):
+        return {}
+
+    with open(path) as f:
+        # Wait for any worker writing to the file to finish.
+        fcntl.flock(f, fcntl.LOCK_SH)
+        content = f.read()
+
+    return json.loads(content) if content else {}
+
+
+class GasTracker:
+    """
+    Records the gas used by each function per scenario and checks it
+    against the stored baseline.
+
+    A measurement can exceed its baseline by at most the budget set for
+    its function in `gas_budgets.py`, in basis points of the baseline.
+    Measurements without a baseline fail. Set GAS_BASELINE_UPDATE=true
+    to write the results to the baseline instead of checking them.
+    """
+
+    def __init__(self, baseline_path=BASELINE_PATH, budgets=BUDGETS):
+        self.baseline_path = baseline_path
+        self.baseline = load_json(baseline_path)
+        self.update = os.getenv("GAS_BASELINE_UPDATE", "false").lower() == "true"
+
+        self.default_budget = DEFAULT_BUDGET
+        self.budgets = budgets
+
+        self.results = {}
+
+    def record(self, function, scenario, gas_used):
+        key = f"{function}[{scenario}]"
+        self.results[key] = gas_used
+
+        if self.update:
+            return
+
+        assert key in self.baseline, (
+            f"{key} has no gas baseline, run with GAS_BASELINE_UPDATE=true "
+            f"and commit {os.path.basename(self.baseline_path)}"
+        )
+
+        baseline = self.baseline[key]
+        budget = self.budgets.get(function, self.default_budget)
+        allowed = baseline * (MAX_BPS + budget) // MAX_BPS
+
+        assert gas_used <= allowed, (
+            f"{key} used {gas_used} gas, over its budget of {allowed} "
+            f"({budget} bps above the baseline of {baseline})"
+        )
+
+    def write(self):
+        if not self.update or not self.results:
+            return
+
+        with open(self.baseline_path, "a+") as f:
+            # Every pytest-xdist worker writes its own results to the same
+            # file, so hold a lock over the whole read, modify and write.
+            fcntl.flock(f, fcntl.LOCK_EX)
+
+            f.seek(0)
+            content = f.read()
+            baseline = json.loads(content) if content else {}
+            baseline.update(self.results)
+
+            f.seek(0)
+            f.truncate()
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
@@ -0,0 +1,9 @@
+# Allowed gas regression over the baseline, in bps of the baseline.
+DEFAULT_BUDGET = 100
+
+# Per function budgets, overriding the default.
+BUDGETS = {
+    "GenericAccountant.report": 50,
+    "Registry.endorseStrategy": 50,
+    "Registry.endorseVault": 50,
+}